@@ -1,5 +1,6 @@
 import numpy as np
 from collections import Counter
+from HW4 import Polynomial
 
 def solve_ode_general(coefficients):
     """
@@ -7,7 +8,8 @@ def solve_ode_general(coefficients):
     Format: a_n y^(n) + ... + a_1 y' + a_0 y = 0
     """
     # 1. Find roots of the characteristic equation
-    roots = np.roots(coefficients)
+    # (memoized, so repeated characteristic polynomials skip the eigen solve)
+    roots = Polynomial.from_descending(coefficients).roots()
     
     # 2. Process roots to handle floating point inaccuracies
     # We round them to avoid treating 1.999999 as different from 2.0
@@ -1,4 +1,6 @@
 import cmath
+import time
+import numpy as np
 
 a = 1
 b = -2
@@ -14,8 +16,50 @@ def root(a,b,c):
         r1 = -b / (2*a)
         r2 = r1
     return r1, r2
-        
-r1, r2 = root(a,b,c)
-print("Root 1 = ", r1)
-print("Root 2 = ", r2)
+
+def root_batch(a, b, c):
+    """
+    Vectorized root() over arrays of coefficients, returns (r1, r2) as complex arrays.
+    Uses q = -(b + sign(b) * sqrt(b^2 - 4ac)) / 2, r = q/a and c/q, which
+    avoids the cancellation in -b + sqrt(...) when b^2 >> 4ac.
+    Rows with a == 0 are solved as bx + c = 0: r1 = -c/b and r2 = nan
+    (both nan when b == 0 as well).
+    """
+    a, b, c = np.broadcast_arrays(*(np.asarray(v, dtype=complex) for v in (a, b, c)))
+    # + 0j clears the -0.0 imaginary part that would put sqrt on the wrong branch
+    sqrt_d = np.sqrt(b * b - 4 * a * c + 0j)
+    sign = np.where(b.real >= 0, 1.0, -1.0)
+    q = -0.5 * (b + sign * sqrt_d)
+    linear = a == 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        from_a = np.where(linear, np.nan, q / np.where(linear, 1, a))
+        # q == 0 only when b == 0 and ac == 0: a double root at 0, or no equation left
+        from_q = np.where(q == 0, np.where(linear, np.nan, 0), c / np.where(q == 0, 1, q))
+    # keep root()'s order: r1 takes +sqrt, r2 takes -sqrt
+    r1 = np.where(linear, from_q, np.where(sign > 0, from_q, from_a))
+    r2 = np.where(linear, np.nan, np.where(sign > 0, from_a, from_q))
+    return r1, r2
+
+def benchmark(n=100000, seed=0):
+    rng = np.random.default_rng(seed)
+    A, B, C = rng.uniform(-10, 10, (3, n))
+
+    start = time.perf_counter()
+    scalar = [root(a, b, c) for a, b, c in zip(A.tolist(), B.tolist(), C.tolist())]
+    t_scalar = time.perf_counter() - start
+
+    start = time.perf_counter()
+    r1, r2 = root_batch(A, B, C)
+    t_batch = time.perf_counter() - start
+
+    expected = np.array(scalar, dtype=complex)
+    err = np.max(np.abs(np.stack([r1, r2], axis=1) - expected))
+    print(f"{n} quadratics: root {t_scalar:.3f}s, root_batch {t_batch:.4f}s "
+          f"({t_scalar / t_batch:.0f}x), max difference {err:.2e}")
+
+if __name__ == "__main__":
+    r1, r2 = root(a,b,c)
+    print("Root 1 = ", r1)
+    print("Root 2 = ", r2)
+    benchmark()
 
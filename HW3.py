@@ -1,6 +1,110 @@
 import cmath
+import math
+import time
+import numpy as np
+from HW2 import root_batch
 
-def root3(a,b,c,d):
+_TWO_THIRDS_PI = 2*math.pi/3
+# |a| below this fraction of the largest other coefficient counts as badly scaled:
+# the closed forms then lose digits steadily as |a| shrinks (all of them by 1e-8),
+# so the largest root is refined and divided out instead
+SCALE_RTOL = 1.0
+
+def _cbrt(x):
+    # real cube root, keeps the sign of negative numbers
+    return math.copysign(abs(x) ** (1/3), x)
+
+def _newton(b, c, d, x):
+    # one Newton step on the monic cubic, kept only if it shrinks the residual
+    f = ((x + b)*x + c)*x + d
+    fp = (3*x + 2*b)*x + c
+    if fp == 0:
+        return x
+    nx = x - f/fp
+    return nx if abs(((nx + b)*nx + c)*nx + d) < abs(f) else x
+
+def _root3_real(p, q, shift):
+    """
+    Solves t^3 + pt + q = 0 without complex arithmetic and returns x = t - shift.
+    delta < 0: three real roots from Viete's trigonometric formula
+    delta > 0: one real root from real cube roots plus a complex pair
+    delta = 0: repeated real roots
+    """
+    h = (q/2)**2
+    g = (p/3)**3
+    delta = h + g
+    if abs(delta) <= 1e-12 * (h - g if g < 0 else h + g):
+        if p == 0:
+            return [-shift] * 3
+        single = 3*q/p - shift
+        double = -3*q/(2*p) - shift
+        return [single, double, double] if single < double else [double, double, single]
+
+    if delta < 0:
+        m = 2 * math.sqrt(-p/3)
+        c = 3*q / (p*m)
+        theta = math.acos(1.0 if c > 1 else -1.0 if c < -1 else c) / 3
+        # theta lies in [0, pi/3], so the k = 0, 2, 1 terms come out in ascending order
+        return [m*math.cos(theta + _TWO_THIRDS_PI) - shift,
+                m*math.cos(theta - _TWO_THIRDS_PI) - shift,
+                m*math.cos(theta) - shift]
+
+    # cube root of the larger of -q/2 +/- sqrt(delta), the other one is -p/(3u)
+    u = _cbrt(-q/2 - math.copysign(math.sqrt(delta), q))
+    v = -p / (3*u)
+    t = u + v
+    imag = math.sqrt(3)/2 * abs(u - v)
+    return [t - shift, complex(-t/2 - shift, imag), complex(-t/2 - shift, -imag)]
+
+def _quadratic_real(b, c):
+    # roots of x^2 + bx + c in real arithmetic: two floats ascending, or a complex pair
+    disc = b*b - 4*c
+    if disc < 0:
+        re, im = -b/2, math.sqrt(-disc)/2
+        return [complex(re, im), complex(re, -im)]
+    # q = -(b + sign(b) sqrt(disc)) / 2 avoids the cancellation in -b + sqrt(disc)
+    q = -0.5 * (b + math.copysign(math.sqrt(disc), b))
+    return sorted([q, c / q if q != 0 else 0.0])
+
+def _deflate(b, c, d, r):
+    """
+    (e, f) with x^3 + bx^2 + cx + d = (x - r)(x^2 + ex + f). Forward division
+    cancels in b + r when r is the large root, backward division in f - c
+    when it is small; the one with the milder cancellation is kept.
+    Works elementwise on arrays too.
+    """
+    e, f = b + r, c + (b + r)*r
+    with np.errstate(divide="ignore", invalid="ignore"):
+        f_back = -d / r
+        e_back = (f_back - c) / r
+    back = (r != 0) & (abs(e) * (abs(f_back) + abs(c)) < abs(f_back - c) * (abs(b) + abs(r)))
+    return np.where(back, e_back, e)[()], np.where(back, f_back, f)[()]
+
+def _root3_deflated(b, c, d):
+    """
+    For x^3 + bx^2 + cx + d from a badly scaled cubic (see SCALE_RTOL): the
+    shift b/3 swamps the small roots in p and q, and for a tiny leading
+    coefficient even the sign of delta (the root count) is lost. The largest
+    real root from _root3_real is still accurate; it is refined with Newton
+    steps and divided out, and the remaining quadratic is solved directly.
+    """
+    roots = _root3_real(c - (b**2)/3, (2*b**3)/27 - (b*c)/3 + d, b/3)
+    r = max((x for x in roots if not isinstance(x, complex)), key=abs)
+    for _ in range(4):
+        r, prev = _newton(b, c, d, r), r
+        if r == prev:
+            break
+    e, f = (float(v) for v in _deflate(b, c, d, np.float64(r)))
+    pair = _quadratic_real(e, f)
+    return [r] + pair if isinstance(pair[0], complex) else sorted([r] + pair)
+
+def root3(a,b,c,d, method="cardano", polish=False):
+    """
+    method: "cardano" (complex arithmetic, always complex roots) or
+            "trig" (real arithmetic, real roots come back as floats)
+    polish: refine every root with one Newton step
+    """
+    badly_scaled = abs(a) < SCALE_RTOL * max(abs(b), abs(c), abs(d))
     b /= a
     c /= a
     d /= a
@@ -8,23 +112,120 @@ def root3(a,b,c,d):
     p = c - (b**2)/3
     q = (2*b**3)/27 - (b*c)/3 + d
 
-    delta = (q/2)**2 + (p/3)**3
+    if method == "trig":
+        roots = _root3_deflated(b, c, d) if badly_scaled else _root3_real(p, q, b/3)
+    elif method == "cardano":
+        delta = (q/2)**2 + (p/3)**3
 
-    u = cmath.sqrt(delta)
-    u_cub = (-q/2 + u) ** (1/3)
-    v_cub = (-q/2 - u) ** (1/3)
+        u = cmath.sqrt(delta)
+        # take the cube root of the larger of -q/2 +/- u, the two cube roots
+        # must satisfy u_cub * v_cub = -p/3
+        w = -q/2 + u if abs(-q/2 + u) >= abs(-q/2 - u) else -q/2 - u
+        u_cub = w ** (1/3)
+        v_cub = -p / (3*u_cub) if u_cub != 0 else 0
 
-    omega = [1, 
-             -0.5 + cmath.sqrt(3)/2*1j,
-             -0.5 - cmath.sqrt(3)/2*1j]
-    
-    roots= []
-    
-    for k in range(3):
-        y = u_cub * omega[k] + v_cub * omega[(3-k) % 3]
-        x = y - b/3
-        roots.append(x)
+        omega = [1, 
+                 -0.5 + cmath.sqrt(3)/2*1j,
+                 -0.5 - cmath.sqrt(3)/2*1j]
+        
+        roots= []
+        
+        for k in range(3):
+            y = u_cub * omega[k] + v_cub * omega[(3-k) % 3]
+            x = y - b/3
+            roots.append(x)
+    else:
+        raise ValueError(f"Unknown method: {method}")
 
+    if polish:
+        roots = [_newton(b, c, d, x) for x in roots]
     return roots
 
-print(root3(1, -6, 11, -6))
+OMEGA = np.array([1, -0.5 + np.sqrt(3)/2*1j, -0.5 - np.sqrt(3)/2*1j])
+
+def _root3_deflated_batch(B, C, D, roots):
+    # _root3_deflated for flat arrays of monic rows, in complex arithmetic:
+    # the largest formula root is refined and divided out
+    r = np.take_along_axis(roots, np.abs(roots).argmax(axis=1)[:, None], axis=1)[:, 0]
+    for _ in range(4):
+        f = ((r + B)*r + C)*r + D
+        fp = (3*r + 2*B)*r + C
+        with np.errstate(divide="ignore", invalid="ignore"):
+            nr = r - f / np.where(fp == 0, 1, fp)
+        # keep a step only if it shrinks the residual, as _newton does
+        r = np.where((fp != 0) & (np.abs(((nr + B)*nr + C)*nr + D) < np.abs(f)), nr, r)
+    e, f = _deflate(B, C, D, r)
+    r1, r2 = root_batch(np.ones_like(e), e, f)
+    return np.stack([r, r1, r2], axis=-1)
+
+def root3_batch(a, b, c, d):
+    """
+    Vectorized root3() over arrays of coefficients, returns complex roots of shape (..., 3).
+    The cube root is taken of whichever of -q/2 +/- sqrt(delta) is larger, and
+    the second one is recovered as v = -p/(3u), which avoids cancellation.
+    Rows with a == 0 are solved as quadratics with root_batch; missing roots are nan.
+    Badly scaled rows (see SCALE_RTOL) keep only the largest root from the
+    formula, Newton-refined, and solve the deflated quadratic.
+    """
+    a, b, c, d = np.broadcast_arrays(*(np.asarray(v, dtype=complex) for v in (a, b, c, d)))
+    cubic = a != 0
+    a_safe = np.where(cubic, a, 1)
+    B, C, D = b / a_safe, c / a_safe, d / a_safe
+
+    p = C - (B**2)/3
+    q = (2*B**3)/27 - (B*C)/3 + D
+    delta = (q/2)**2 + (p/3)**3 + 0j
+
+    s = np.sqrt(delta)
+    w = np.where(np.abs(-q/2 + s) >= np.abs(-q/2 - s), -q/2 + s, -q/2 - s)
+    u = w ** (1/3)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        v = np.where(u == 0, 0, -p / (3 * np.where(u == 0, 1, u)))
+
+    y = u[..., None] * OMEGA + v[..., None] * OMEGA[[0, 2, 1]]
+    roots = y - (B/3)[..., None]
+
+    scale = np.maximum(np.maximum(np.abs(b), np.abs(c)), np.abs(d))
+    bad = cubic & (np.abs(a) < SCALE_RTOL * scale)
+    if bad.any():
+        roots[bad] = _root3_deflated_batch(B[bad], C[bad], D[bad], roots[bad])
+
+    r1, r2 = root_batch(b, c, d)
+    quadratic = np.stack([r1, r2, np.full_like(r1, np.nan)], axis=-1)
+    return np.where(cubic[..., None], roots, quadratic)
+
+def benchmark(n=100000, seed=0):
+    rng = np.random.default_rng(seed)
+    A, B, C, D = rng.uniform(-10, 10, (4, n))
+
+    start = time.perf_counter()
+    scalar = [root3(a, b, c, d) for a, b, c, d in zip(A.tolist(), B.tolist(), C.tolist(), D.tolist())]
+    t_scalar = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch = root3_batch(A, B, C, D)
+    t_batch = time.perf_counter() - start
+
+    # compare relative residuals |P(x)| / sum(|a_k x^k|), since the two
+    # solvers may list the roots in a different order
+    def residual(r):
+        a, b, c, d = (v[:, None] for v in (A, B, C, D))
+        scale = np.abs(a*r**3) + np.abs(b*r**2) + np.abs(c*r) + np.abs(d)
+        return np.max(np.abs(((a*r + b)*r + c)*r + d) / scale)
+    print(f"{n} cubics: root3 {t_scalar:.3f}s, root3_batch {t_batch:.4f}s ({t_scalar / t_batch:.0f}x)")
+    print(f"max relative residual: root3 {residual(np.array(scalar)):.2e}, root3_batch {residual(batch):.2e}")
+
+if __name__ == "__main__":
+    print(root3(1, -6, 11, -6))
+    print(root3(1, -6, 11, -6, method="trig", polish=True))
+    print(root3_batch([1, 2, 0], [-6, 0, 1], [11, 0, -3], [-6, -16, 2]))
+
+    # badly scaled: one root near -1e8 and a complex pair near the roots of x^2 + x + 1
+    expected = np.sort_complex(np.roots([1e-8, 1, 1, 1]))
+    trig = root3(1e-8, 1, 1, 1, method="trig")
+    assert isinstance(trig[0], float) and isinstance(trig[1], complex)
+    assert np.allclose(np.sort_complex(np.array(trig, dtype=complex)), expected, rtol=1e-12)
+    assert np.allclose(np.sort_complex(root3_batch(1e-8, 1, 1, 1)), expected, rtol=1e-12)
+    # three real roots of very different size
+    assert np.allclose(root3(1e-8, 1, 1, 1e-8, method="trig"), [-99999999.0, -1.0, -1e-8], rtol=1e-12)
+    benchmark()
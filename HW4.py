@@ -1,23 +1,219 @@
+import time
+from functools import lru_cache
 import numpy as np
 
-def root(c):
-  while len(c) > 1 and abs(c[-1]) < 1e-14:
-    c.pop()
-    
-  n = len(c) - 1;
-  
+def trim(c, tol=1e-14):
+  # drop vanishing leading coefficients without touching the caller's list
+  c = np.asarray(c)
+  n = len(c)
+  while n > 1 and abs(c[n-1]) < tol:
+    n -= 1
+  return c[:n]
+
+class CompanionSolver:
+  """
+  Eigenvalue root finder for a stack of same-degree polynomials.
+  The (batch, n, n) companion buffer, with its sub-diagonal of ones, is
+  allocated in __init__ and again only when a call brings a larger batch.
+  Each call overwrites the first row of the leading len(C) companions with
+  the new coefficients and runs one batched eigvals; the ones stay in place.
+  Coefficients are in ascending order: c[0] + c[1] x + ... + c[n] x^n.
+  An instance is not safe to share between threads: keep one per caller.
+  """
+
+  def __init__(self, degree, batch=1, dtype=float):
+    self.degree = degree
+    self.dtype = np.dtype(dtype)
+    self._grow(batch)
+
+  def _grow(self, batch):
+    n = self.degree
+    self.buffer = np.zeros((batch, n, n), dtype=self.dtype)
+    self.buffer[:, 1:, :-1] = np.eye(n-1)
+
+  def __call__(self, C):
+    C = np.asarray(C, dtype=self.dtype)
+    if C.shape[-1] != self.degree + 1:
+      raise ValueError(f"Expected {self.degree + 1} coefficients, got {C.shape[-1]}")
+    if len(C) > len(self.buffer):
+      self._grow(len(C))
+    companion = self.buffer[:len(C)]
+    companion[:, 0, :] = -C[:, -2::-1] / C[:, -1:]
+    return np.linalg.eigvals(companion).astype(complex)
+
+def _horner(C, z):
+  # p(z) and p'(z) for every row of C at every point of the matching row of z
+  p = np.broadcast_to(C[:, -1:], z.shape).astype(complex)
+  dp = np.zeros_like(p)
+  for k in range(C.shape[1] - 2, -1, -1):
+    dp = dp * z + p
+    p = p * z + C[:, k:k+1]
+  return p, dp
+
+def aberth(C, tol=1e-12, max_iter=100):
+  """
+  Aberth-Ehrlich simultaneous iteration, O(n^2) per step, for a stack of
+  same-degree polynomials (batch, n+1) in ascending order. Returns (batch, n).
+  Rows drop out of the iteration as soon as all their roots have converged.
+  """
+  C = np.asarray(C, dtype=complex)
+  C = C / C[:, -1:]
+  batch, n = C.shape[0], C.shape[1] - 1
+
+  # start on a circle whose radius is the geometric mean of the root moduli,
+  # rotated off the real axis so conjugate pairs can separate
+  radius = np.abs(C[:, 0]) ** (1/n)
+  radius[radius == 0] = 1.0
+  z = radius[:, None] * np.exp(1j * (2*np.pi*np.arange(n)/n + 0.4))
+
+  eye = np.eye(n, dtype=bool)
+  active = np.arange(batch)
+  for _ in range(max_iter):
+    if active.size == 0:
+      break
+    Ca, za = C[active], z[active]
+    p, dp = _horner(Ca, za)
+    with np.errstate(divide="ignore", invalid="ignore"):
+      ratio = np.where(p == 0, 0, p / dp)
+      inv = 1 / (za[:, :, None] - za[:, None, :])
+    inv[:, eye] = 0
+    w = ratio / (1 - ratio * inv.sum(axis=2))
+    w[~np.isfinite(w)] = 0
+    z[active] = za - w
+    converged = np.all(np.abs(w) <= tol * np.maximum(1, np.abs(z[active])), axis=1)
+    active = active[~converged]
+  return z
+
+def root_batch(C, method="eig"):
+  """
+  Roots of a stack of same-degree polynomials, shape (batch, n+1) in ascending
+  order. method: "eig" (batched companion eigenvalues) or "aberth".
+  Returns a complex array of shape (batch, n).
+  """
+  C = np.atleast_2d(np.asarray(C))
+  if np.any(C[:, -1] == 0):
+    raise ValueError("Leading coefficients must be nonzero")
+  n = C.shape[1] - 1
+  if n == 0:
+    return np.zeros((len(C), 0), dtype=complex)
+  if method == "eig":
+    dtype = complex if np.iscomplexobj(C) else float
+    # a fresh buffer per call: concurrent callers never share one
+    return CompanionSolver(n, len(C), dtype)(C)
+  if method == "aberth":
+    return aberth(C)
+  raise ValueError(f"Unknown method: {method}")
+
+@lru_cache(maxsize=4096)
+def _cached_roots(key, method):
+  # key is the monic coefficient tuple, so scaled copies of a polynomial share an entry
+  c = np.array(key)
+  n = len(c) - 1
   if n == 0:
-    return "no roots"
-  if n == 1:
-    return [-c[0]/c[1]]
-  
-  
-  companion = np.zeros((n, n))
-  companion[1:, :-1] = np.eye(n-1)
-  companion[0, :] = -np.array(c[:-1])
-  
-  roots = np.linalg.eigvals(companion)
+    roots = np.array([], dtype=complex)
+  elif n == 1:
+    roots = np.array([-c[0]], dtype=complex)
+  else:
+    roots = root_batch(c[None, :], method)[0]
+  roots.setflags(write=False)
   return roots
-  
-coeffs = [-8, 14, -7, 1]
-print(root(coeffs))
\ No newline at end of file
+
+class Polynomial:
+  """
+  c[0] + c[1] x + ... + c[n] x^n with a read-only contiguous coefficient array.
+  Roots are memoized per normalized coefficient tuple, so repeated (or
+  rescaled) polynomials skip the eigen solve.
+  """
+  __slots__ = ("coef",)
+
+  def __init__(self, coef):
+    c = np.asarray(coef)
+    c = np.ascontiguousarray(trim(c), dtype=complex if np.iscomplexobj(c) else float)
+    c.setflags(write=False)
+    self.coef = c
+
+  @classmethod
+  def from_descending(cls, coef):
+    # np.roots / np.polyval order: highest power first
+    return cls(np.asarray(coef)[::-1])
+
+  @property
+  def degree(self):
+    return len(self.coef) - 1
+
+  def __call__(self, x):
+    # Horner's method, vectorized over x
+    x = np.asarray(x)
+    y = np.full(x.shape, self.coef[-1], dtype=np.result_type(x, self.coef))
+    for a in self.coef[-2::-1]:
+      y = y * x + a
+    return y
+
+  def derivative(self):
+    if self.degree == 0:
+      return Polynomial([0])
+    return Polynomial(self.coef[1:] * np.arange(1, len(self.coef)))
+
+  def deflate(self, r):
+    """Synthetic division by (x - r), returns (quotient, remainder)."""
+    n = self.degree
+    if n == 0:
+      return Polynomial([0]), self.coef[0]
+    q = np.empty(n, dtype=np.result_type(self.coef, r))
+    acc = self.coef[-1]
+    for k in range(n-1, -1, -1):
+      q[k] = acc
+      acc = acc * r + self.coef[k]
+    return Polynomial(q), np.asarray(acc).item()
+
+  def key(self):
+    return tuple((self.coef / self.coef[-1]).tolist())
+
+  def roots(self, method="eig"):
+    if self.degree == 0 and self.coef[0] == 0:
+      raise ValueError("The zero polynomial has no finite set of roots")
+    # the cached array stays frozen; callers get their own writable copy
+    return _cached_roots(self.key(), method).copy()
+
+  def __eq__(self, other):
+    return isinstance(other, Polynomial) and np.array_equal(self.coef, other.coef)
+
+  def __hash__(self):
+    return hash(tuple(self.coef.tolist()))
+
+  def __repr__(self):
+    return f"Polynomial({self.coef.tolist()})"
+
+def root(c, method="eig"):
+  return Polynomial(c).roots(method)
+
+def benchmark(count=10000, degree=20, seed=0):
+  rng = np.random.default_rng(seed)
+  C = rng.standard_normal((count, degree + 1))
+
+  start = time.perf_counter()
+  for c in C:
+    companion = np.zeros((degree, degree))
+    companion[1:, :-1] = np.eye(degree-1)
+    companion[0, :] = -c[-2::-1] / c[-1]
+    np.linalg.eigvals(companion)
+  t_loop = time.perf_counter() - start
+
+  for method in ("eig", "aberth"):
+    start = time.perf_counter()
+    R = root_batch(C, method)
+    t = time.perf_counter() - start
+    err = np.max(np.abs(np.polyval(C[:, ::-1].T, R.T)) / np.polyval(np.abs(C[:, ::-1]).T, np.abs(R.T)))
+    print(f"{count} degree-{degree} polynomials: per-call loop {t_loop:.3f}s, "
+          f"root_batch({method!r}) {t:.3f}s, max relative residual {err:.1e}")
+
+if __name__ == "__main__":
+  coeffs = [-8, 14, -7, 1]
+  print(root(coeffs))
+  print(root(coeffs, method="aberth"))
+
+  P = Polynomial(coeffs)
+  print(P, "at x = 0..4:", P(np.arange(5)))
+  print("derivative:", P.derivative())
+  print("deflated by (x - 4):", P.deflate(4))
+  benchmark()
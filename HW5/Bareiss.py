@@ -0,0 +1,115 @@
+import math
+import numbers
+from HW5 import Rational
+
+def to_rational(x):
+    # exact conversion: ints, Rationals, and floats through as_integer_ratio()
+    if isinstance(x, Rational):
+        return x
+    if isinstance(x, numbers.Integral):
+        return Rational(int(x), 1)
+    return Rational(*float(x).as_integer_ratio())
+
+def _integer_rows(rows):
+    """
+    Scales every row by the lcm of its denominators, so the matrix holds only
+    Python ints. Returns (int_rows, scales); row i was multiplied by scales[i].
+    """
+    int_rows, scales = [], []
+    for row in rows:
+        row = [to_rational(x) for x in row]
+        scale = 1
+        for x in row:
+            scale = scale * x.den // math.gcd(scale, x.den)
+        int_rows.append([x.num * (scale // x.den) for x in row])
+        scales.append(scale)
+    return int_rows, scales
+
+def _eliminate(M, n):
+    """
+    Fraction-free (Bareiss) elimination of the first n columns of M in place.
+    Every division is exact and entries stay bounded by minors of the input,
+    so there is no coefficient blow-up. Returns the sign of the row swaps, or
+    0 if the leading n x n block is singular.
+    """
+    sign = 1
+    prev = 1
+    width = len(M[0])
+    for k in range(n):
+        if M[k][k] == 0:
+            for i in range(k+1, n):
+                if M[i][k] != 0:
+                    M[k], M[i] = M[i], M[k]
+                    sign = -sign
+                    break
+            else:
+                return 0
+        pivot = M[k][k]
+        row_k = M[k]
+        for i in range(k+1, n):
+            row_i = M[i]
+            factor = row_i[k]
+            for j in range(k+1, width):
+                row_i[j] = (row_i[j] * pivot - factor * row_k[j]) // prev
+            row_i[k] = 0
+        prev = pivot
+    return sign
+
+def determinant(A):
+    """Exact determinant of a square integer/Rational/float matrix, as a Rational."""
+    M, scales = _integer_rows(A)
+    n = len(M)
+    if n == 0:
+        return Rational(1, 1)
+    if any(len(row) != n for row in M):
+        raise ValueError("Matrix must be square")
+    sign = _eliminate(M, n)
+    scale = 1
+    for s in scales:
+        scale *= s
+    return Rational(sign * M[n-1][n-1], scale)
+
+def solve(A, b):
+    """
+    Exact solution of A x = b. b is a vector (returns a list of Rationals) or
+    a matrix of right-hand sides (returns a list of rows).
+    """
+    n = len(A)
+    vector = not hasattr(b[0], "__len__")
+    B = [[x] for x in b] if vector else [list(row) for row in b]
+    M, _ = _integer_rows([list(A[i]) + list(B[i]) for i in range(n)])
+    if any(len(row) != n + len(B[0]) for row in M):
+        raise ValueError("Matrix must be square")
+    if _eliminate(M, n) == 0:
+        raise ValueError("Matrix is singular")
+
+    # back substitution; the pivots are minors of A, so the values stay small
+    X = [[None] * len(B[0]) for _ in range(n)]
+    for c in range(len(B[0])):
+        for i in range(n-1, -1, -1):
+            acc = Rational(M[i][n+c], 1)
+            for j in range(i+1, n):
+                acc = acc + Rational(-M[i][j], 1) * X[j][c]
+            X[i][c] = acc * Rational(1, M[i][i])
+    return [row[0] for row in X] if vector else X
+
+def inverse(A):
+    n = len(A)
+    identity = [[int(i == j) for j in range(n)] for i in range(n)]
+    return solve(A, identity)
+
+if __name__ == "__main__":
+    A = [[2, 1, -1],
+         [-3, -1, 2],
+         [-2, 1, 2]]
+    b = [8, -11, -3]
+    print("det(A) =", determinant(A))
+    print("x =", solve(A, b))
+    print("inverse(A) =", inverse(A))
+
+    # Hilbert matrix: the classic ill-conditioned system
+    n = 8
+    H = [[Rational(1, i + j + 1) for j in range(n)] for i in range(n)]
+    x = solve(H, [Rational(1, 1)] * n)
+    print(f"det(H_{n}) =", determinant(H))
+    print(f"H_{n} x = 1 ->", x)
@@ -1,62 +1,437 @@
 import math
+import numbers
+import sys
+import time
+from collections import Counter
+from fractions import Fraction
+import numpy as np
+
+_new = object.__new__
+_HASH_MODULUS = sys.hash_info.modulus
+_HASH_INF = sys.hash_info.inf
+# small normalized values, filled in below the class
+_interned = {}
+
+def _make(num, den, normalized):
+    # trusted constructor: den > 0 and `normalized` tells whether gcd(num, den) == 1
+    r = _new(Rational)
+    r._num, r._den, r._normalized = num, den, normalized
+    return r
 
 class Rational:
-    def __init__(self, numerator, denominator):
+    __slots__ = ("_num", "_den", "_normalized", "_hash")
+
+    def __new__(cls, numerator, denominator=1, normalize=True):
         if denominator == 0:
             raise ValueError("Denominator cannot be zero")
-        self.num = numerator
-        self.den = denominator
-        self._reduce()
+        if denominator < 0:
+            numerator, denominator = -numerator, -denominator
+        if normalize:
+            g = math.gcd(numerator, denominator)
+            if g != 1:
+                numerator //= g
+                denominator //= g
+            if cls is Rational:
+                cached = _interned.get((numerator, denominator))
+                if cached is not None:
+                    return cached
+        self = _new(cls)
+        self._num = numerator
+        self._den = denominator
+        self._normalized = normalize
+        return self
+
+    def __reduce__(self):
+        return (Rational, (self.num, self.den))
 
     def _reduce(self):
         # menyederhanakan pecahan
-        g = math.gcd(self.num, self.den)
-        self.num //= g
-        self.den //= g
-        if self.den < 0:
-            self.num *= -1
-            self.den *= -1
+        if not self._normalized:
+            g = math.gcd(self._num, self._den)
+            if g != 1:
+                self._num //= g
+                self._den //= g
+            self._normalized = True
+        return self
+
+    # reading num/den forces the lazy normalization
+    @property
+    def num(self):
+        return self._reduce()._num
+
+    @property
+    def den(self):
+        return self._reduce()._den
+
+    def deferred(self):
+        """
+        Copy whose arithmetic skips gcd reduction; anything combined with it
+        stays unreduced until compared, printed or read through num/den.
+        """
+        return _make(self._num, self._den, False)
+
     def __add__(self, other):
-        return Rational(self.num * other.den + self.den * other.num,
-                        self.den * other.den)
+        if isinstance(other, int):
+            # n/d + k = (n + kd)/d is still in lowest terms
+            return _make(self._num + other * self._den, self._den, self._normalized)
+        if not isinstance(other, Rational):
+            if isinstance(other, numbers.Integral):
+                return self + int(other)
+            return NotImplemented
+        na, da, nb, db = self._num, self._den, other._num, other._den
+        normalized = self._normalized and other._normalized
+        if not normalized:
+            num, den = na * db + da * nb, da * db
+        else:
+            # Henrici: only gcd(t, g) can be left to cancel, and g is small
+            g = math.gcd(da, db)
+            if g == 1:
+                num, den = na * db + da * nb, da * db
+            else:
+                s = da // g
+                t = na * (db // g) + nb * s
+                g2 = math.gcd(t, g)
+                num, den = (t, s * db) if g2 == 1 else (t // g2, s * (db // g2))
+        # built in place rather than through _make: this is the hot path
+        r = _new(Rational)
+        r._num, r._den, r._normalized = num, den, normalized
+        return r
+
+    __radd__ = __add__
 
     def __mul__(self, other):
-        return Rational(self.num * other.num,
-                        self.den * other.den)
+        if isinstance(other, int):
+            if not self._normalized:
+                return _make(self._num * other, self._den, False)
+            g = math.gcd(other, self._den)
+            return _make(self._num * (other // g), self._den // g, True)
+        if not isinstance(other, Rational):
+            if isinstance(other, numbers.Integral):
+                return self * int(other)
+            return NotImplemented
+        na, da, nb, db = self._num, self._den, other._num, other._den
+        normalized = self._normalized and other._normalized
+        if not normalized:
+            num, den = na * nb, da * db
+        elif na == 0 or nb == 0:
+            num, den = 0, 1
+        else:
+            # cross-reduce before multiplying so the product is already in lowest terms
+            g1 = math.gcd(na, db)
+            g2 = math.gcd(nb, da)
+            num, den = (na // g1) * (nb // g2), (da // g2) * (db // g1)
+        r = _new(Rational)
+        r._num, r._den, r._normalized = num, den, normalized
+        return r
+
+    __rmul__ = __mul__
+
     def __neg__(self):
-        return Rational(-self.num, self.den)
+        return _make(-self._num, self._den, self._normalized)
 
     def inverse(self):
-        if self.num == 0:
+        if self._num == 0:
             raise ZeroDivisionError("Zero has no multiplicative inverse")
-        return Rational(self.den, self.num)
+        if self._num < 0:
+            return _make(-self._den, -self._num, self._normalized)
+        return _make(self._den, self._num, self._normalized)
 
     def __eq__(self, other):
-        return self.num == other.num and self.den == other.den
+        if self is other:
+            return True
+        if isinstance(other, Rational):
+            return self.num == other.num and self.den == other.den
+        if isinstance(other, int):
+            return self.den == 1 and self._num == other
+        if isinstance(other, numbers.Rational):
+            return self.num == other.numerator and self.den == other.denominator
+        if isinstance(other, float):
+            return math.isfinite(other) and self == Rational(*other.as_integer_ratio())
+        return NotImplemented
+
+    def __hash__(self):
+        # same scheme as int and fractions.Fraction, so equal values hash alike
+        try:
+            return self._hash
+        except AttributeError:
+            pass
+        num, den = self.num, self.den
+        if den == 1:
+            h = hash(num)
+        else:
+            try:
+                inv = pow(den, -1, _HASH_MODULUS)
+            except ValueError:
+                h = _HASH_INF
+            else:
+                h = hash(hash(abs(num)) * inv)
+            if num < 0:
+                h = -h
+            if h == -1:
+                h = -2
+        self._hash = h
+        return h
+
     def __repr__(self):
         return f"{self.num}/{self.den}"
 
-a = Rational(1, 2)
-b = Rational(1, 3)
-c = Rational(1, 4)
-
-# Asosiatif
-assert (a + (b + c)) == ((a + b) + c)
-# Identitas
-assert (a + Rational(0, 1)) == a
-# Invers
-assert (a + (-a)) == Rational(0, 1)
-# Komutatif
-assert (a + b) == (b + a)
-
-
-# Asosiatif
-assert (a * (b * c)) == ((a * b) * c)
-# Identitas
-assert (a * Rational(1, 1)) == a
-# Invers
-assert (a * a.inverse()) == Rational(1, 1)
-# Distributif
-assert a * (b + c) == (a * b) + (a * c)
-
-print("All tests passed!")
+_interned.update(((n, d), _make(n, d, True))
+                 for d in range(1, 17) for n in range(-16, 17) if math.gcd(n, d) == 1)
+
+_INT64_MAX = np.iinfo(np.int64).max
+
+def _bound(a):
+    # largest magnitude in the array as a Python int
+    return int(np.max(np.abs(a))) if a.size else 0
+
+def _as_parts(value):
+    # numerator / denominator arrays of anything RationalArray can mix with
+    if isinstance(value, RationalArray):
+        return value.num, value.den
+    if isinstance(value, Rational):
+        value = (value.num, value.den)
+        return _int_array(value[0]), _int_array(value[1])
+    return _int_array(value), _int_array(1)
+
+def _int_array(values):
+    a = np.asarray(values)
+    if a.dtype == object or a.dtype.kind not in "iub":
+        if a.dtype.kind == "f":
+            raise TypeError("RationalArray needs integer numerators and denominators")
+        a = np.asarray(a, dtype=object)
+        return a.astype(np.int64) if _bound(a) <= _INT64_MAX else a
+    return a.astype(np.int64)
+
+def _promote(*arrays):
+    return [a.astype(object) for a in arrays]
+
+def _normalize(num, den):
+    if np.any(den == 0):
+        raise ValueError("Denominator cannot be zero")
+    sign = np.where(den < 0, -1, 1)
+    g = np.gcd(num, den)
+    num, den = sign * (num // g), sign * (den // g)
+    # fall back to int64 once the values fit again
+    if num.dtype == object and max(_bound(num), _bound(den)) <= _INT64_MAX:
+        num, den = num.astype(np.int64), den.astype(np.int64)
+    return num, den
+
+def _add(n1, d1, n2, d2):
+    g = np.gcd(d1, d2)
+    a, b = d1 // g, d2 // g
+    if object not in (n1.dtype, n2.dtype, d1.dtype, d2.dtype):
+        if (_bound(n1) * _bound(b) + _bound(n2) * _bound(a) > _INT64_MAX
+                or _bound(a) * _bound(d2) > _INT64_MAX):
+            n1, n2, a, b, d2 = _promote(n1, n2, a, b, d2)
+    return _normalize(n1 * b + n2 * a, a * d2)
+
+def _mul(n1, d1, n2, d2):
+    # cross-reduce first, so the products are already in lowest terms
+    g1 = np.gcd(n1, d2)
+    g2 = np.gcd(n2, d1)
+    n1, d2 = n1 // g1, d2 // g1
+    n2, d1 = n2 // g2, d1 // g2
+    if object not in (n1.dtype, n2.dtype, d1.dtype, d2.dtype):
+        if _bound(n1) * _bound(n2) > _INT64_MAX or _bound(d1) * _bound(d2) > _INT64_MAX:
+            n1, n2, d1, d2 = _promote(n1, n2, d1, d2)
+    return n1 * n2, d1 * d2
+
+class RationalArray:
+    """
+    Array of fractions stored as paired int64 numerator/denominator arrays.
+    Arithmetic is elementwise with vectorized np.gcd reduction; results that
+    would overflow int64 switch to Python ints (object dtype).
+    """
+    __slots__ = ("num", "den")
+
+    def __init__(self, numerator, denominator=1):
+        num, den = np.broadcast_arrays(_int_array(numerator), _int_array(denominator))
+        if object in (num.dtype, den.dtype):
+            num, den = _promote(num, den)
+        self.num, self.den = _normalize(num, den)
+
+    @classmethod
+    def _from_parts(cls, num, den):
+        # parts are already normalized
+        self = cls.__new__(cls)
+        self.num, self.den = num, den
+        return self
+
+    @classmethod
+    def from_rationals(cls, values):
+        values = list(values)
+        return cls([v.num for v in values], [v.den for v in values])
+
+    @property
+    def shape(self):
+        return self.num.shape
+
+    def __len__(self):
+        return len(self.num)
+
+    def __getitem__(self, index):
+        num, den = self.num[index], self.den[index]
+        if np.ndim(num) == 0:
+            return Rational(int(num), int(den))
+        return RationalArray._from_parts(num, den)
+
+    def __add__(self, other):
+        try:
+            n2, d2 = _as_parts(other)
+        except TypeError:
+            return NotImplemented
+        return RationalArray._from_parts(*_add(self.num, self.den, n2, d2))
+
+    __radd__ = __add__
+
+    def __mul__(self, other):
+        try:
+            n2, d2 = _as_parts(other)
+        except TypeError:
+            return NotImplemented
+        return RationalArray._from_parts(*_mul(self.num, self.den, n2, d2))
+
+    __rmul__ = __mul__
+
+    def __neg__(self):
+        return RationalArray._from_parts(-self.num, self.den)
+
+    def __sub__(self, other):
+        return self + (-RationalArray(*_as_parts(other)))
+
+    def __rsub__(self, other):
+        return (-self) + other
+
+    def inverse(self):
+        if np.any(self.num == 0):
+            raise ZeroDivisionError("Zero has no multiplicative inverse")
+        return RationalArray(self.den, self.num)
+
+    def __eq__(self, other):
+        n2, d2 = _as_parts(other)
+        return (self.num == n2) & (self.den == d2)
+
+    __hash__ = None
+
+    def sum(self):
+        # pairwise tree reduction: log2(n) vectorized additions
+        num, den = self.num.ravel(), self.den.ravel()
+        if num.size == 0:
+            return Rational(0, 1)
+        while num.size > 1:
+            if num.size % 2:
+                num = np.append(num, 0).astype(num.dtype)
+                den = np.append(den, 1).astype(den.dtype)
+            num, den = _add(num[0::2], den[0::2], num[1::2], den[1::2])
+        return Rational(int(num[0]), int(den[0]))
+
+    def dot(self, other):
+        return (self * other).sum()
+
+    def to_float(self):
+        return self.num.astype(float) / self.den.astype(float)
+
+    def tolist(self):
+        return [Rational(int(n), int(d)) for n, d in zip(self.num.ravel(), self.den.ravel())]
+
+    def __repr__(self):
+        return f"RationalArray({[f'{n}/{d}' for n, d in zip(self.num.ravel(), self.den.ravel())]})"
+
+def benchmark(n=1000000, seed=0):
+    rng = np.random.default_rng(seed)
+    num = rng.integers(-20, 20, n)
+    den = rng.integers(1, 13, n)
+
+    start = time.perf_counter()
+    total = Rational(0, 1)
+    for p, q in zip(num.tolist(), den.tolist()):
+        total = total + Rational(p, q)
+    t_loop = time.perf_counter() - start
+
+    start = time.perf_counter()
+    array_total = RationalArray(num, den).sum()
+    t_array = time.perf_counter() - start
+
+    assert total == array_total
+    print(f"sum of {n} fractions: Rational loop {t_loop:.2f}s, RationalArray.sum {t_array:.3f}s -> {total}")
+
+def benchmark_normalization(n=500, seed=0):
+    rng = np.random.default_rng(seed)
+    values = [Rational(int(p), int(q)) for p, q in rng.integers(1, 10**18, (n, 2))]
+
+    # eager: the full-gcd constructor at every step
+    def eager_add(x, y):
+        return Rational(x.num * y.den + x.den * y.num, x.den * y.den)
+
+    def eager_mul(x, y):
+        return Rational(x.num * y.num, x.den * y.den)
+
+    for name, eager, op in (("sum", eager_add, Rational.__add__), ("product", eager_mul, Rational.__mul__)):
+        timings, totals = [], []
+        for start, step in ((values[0], eager), (values[0], op), (values[0].deferred(), op)):
+            t = time.perf_counter()
+            total = start
+            for v in values[1:]:
+                total = step(total, v)
+            total._reduce()
+            timings.append(time.perf_counter() - t)
+            totals.append(total)
+        assert totals[0] == totals[1] == totals[2]
+        print(f"{name} of {n} fractions: eager {timings[0]:.3f}s, "
+              f"Henrici/cross-reduced {timings[1]:.3f}s, deferred {timings[2]:.3f}s")
+
+def benchmark_hashing(n=1000000, seed=0):
+    rng = np.random.default_rng(seed)
+    pairs = list(zip(rng.integers(-8, 9, n).tolist(), rng.integers(1, 9, n).tolist()))
+
+    for name, make in (("int", None), ("Fraction", Fraction), ("Rational", Rational)):
+        start = time.perf_counter()
+        if make is None:
+            counts = Counter(p * 840 // q for p, q in pairs)
+        else:
+            counts = Counter(make(p, q) for p, q in pairs)
+        print(f"Counter over {n} {name} ratios: {time.perf_counter() - start:.2f}s, {len(counts)} distinct")
+
+if __name__ == "__main__":
+    a = Rational(1, 2)
+    b = Rational(1, 3)
+    c = Rational(1, 4)
+
+    # Asosiatif
+    assert (a + (b + c)) == ((a + b) + c)
+    # Identitas
+    assert (a + Rational(0, 1)) == a
+    # Invers
+    assert (a + (-a)) == Rational(0, 1)
+    # Komutatif
+    assert (a + b) == (b + a)
+
+
+    # Asosiatif
+    assert (a * (b * c)) == ((a * b) * c)
+    # Identitas
+    assert (a * Rational(1, 1)) == a
+    # Invers
+    assert (a * a.inverse()) == Rational(1, 1)
+    # Distributif
+    assert a * (b + c) == (a * b) + (a * c)
+
+    print("All tests passed!")
+
+    # RationalArray follows the same axioms elementwise
+    x = RationalArray([1, 2, -3], [2, 3, 4])
+    y = RationalArray([1, -1, 5], [3, 6, 7])
+    assert np.all((x + y) == (y + x))
+    assert np.all(x * (y + x) == (x * y) + (x * x))
+    assert np.all((x + (-x)) == RationalArray([0, 0, 0]))
+    assert np.all(x * x.inverse() == RationalArray([1, 1, 1]))
+    assert x.dot(y) == Rational(1, 6) + Rational(-2, 18) + Rational(-15, 28)
+    assert (x + a)[0] == Rational(1, 1)
+    print("RationalArray tests passed!")
+    benchmark()
+    benchmark_normalization()
+
+    # hashes agree with int and Fraction, so they share dict slots
+    assert hash(Rational(1, 3)) == hash(Fraction(1, 3)) and hash(Rational(4, 2)) == hash(2)
+    assert {Rational(1, 2): "half"}[Fraction(1, 2)] == "half"
+    benchmark_hashing()
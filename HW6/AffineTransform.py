@@ -0,0 +1,268 @@
+from __future__ import annotations
+import math
+import time
+from functools import lru_cache
+from typing import List, Optional, Tuple, Union
+import numpy as np
+
+from HW6 import EPS, Point, Line, Circle, Triangle
+from GeometryArrays import PointArray, LineArray, CircleArray, TriangleArray
+
+Shape = Union[Point, Line, Circle, Triangle]
+
+# ---------------------------
+# Cached elementary matrices (read-only, shared between transforms)
+# ---------------------------
+
+def _frozen(m: np.ndarray) -> np.ndarray:
+    m.setflags(write=False)
+    return m
+
+@lru_cache(maxsize=1024)
+def translation_matrix(dx: float, dy: float) -> np.ndarray:
+    return _frozen(np.array([[1.0, 0.0, dx], [0.0, 1.0, dy], [0.0, 0.0, 1.0]]))
+
+@lru_cache(maxsize=1024)
+def scaling_matrix(sx: float, sy: float, cx: float = 0.0, cy: float = 0.0) -> np.ndarray:
+    return _frozen(np.array([[sx, 0.0, cx - sx * cx], [0.0, sy, cy - sy * cy], [0.0, 0.0, 1.0]]))
+
+@lru_cache(maxsize=1024)
+def rotation_matrix(angle_degrees: float, cx: float = 0.0, cy: float = 0.0) -> np.ndarray:
+    # cos/sin are evaluated once per distinct (angle, center)
+    theta = math.radians(angle_degrees)
+    c, s = math.cos(theta), math.sin(theta)
+    return _frozen(np.array([[c, -s, cx - c * cx + s * cy], [s, c, cy - s * cx - c * cy], [0.0, 0.0, 1.0]]))
+
+def _center(center: Optional[Point]) -> Tuple[float, float]:
+    return (0.0, 0.0) if center is None else (center.x, center.y)
+
+# ---------------------------
+# AffineTransform
+# ---------------------------
+class AffineTransform:
+    """
+    A 2D affine map as a homogeneous 3x3 matrix. translate/scale/rotate
+    return a new transform that applies the step after the existing ones;
+    the steps are only multiplied together the first time the matrix is
+    needed, and the result (and its inverse) is kept. Applying the transform
+    costs one matrix multiply regardless of how many steps it was built from.
+    """
+    __slots__ = ("_steps", "_matrix", "_coef", "_inverse")
+
+    def __init__(self, matrix=None):
+        self._steps: Tuple[np.ndarray, ...] = ()
+        self._matrix = None if matrix is None else _frozen(np.array(matrix, dtype=float).reshape(3, 3))
+        self._coef = None
+        self._inverse = None
+
+    def _then(self, step: np.ndarray) -> "AffineTransform":
+        t = AffineTransform.__new__(AffineTransform)
+        if self._matrix is not None:
+            t._steps = (self._matrix, step)
+        else:
+            t._steps = self._steps + (step,)
+        t._matrix = t._coef = t._inverse = None
+        return t
+
+    # ---------------------------
+    # Construction
+    # ---------------------------
+
+    def translate(self, dx: float, dy: float) -> "AffineTransform":
+        return self._then(translation_matrix(float(dx), float(dy)))
+
+    def scale(self, sx: float, sy: Optional[float] = None, center: Optional[Point] = None) -> "AffineTransform":
+        if sy is None:
+            sy = sx
+        return self._then(scaling_matrix(float(sx), float(sy), *_center(center)))
+
+    def rotate(self, angle_degrees: float, center: Optional[Point] = None) -> "AffineTransform":
+        return self._then(rotation_matrix(float(angle_degrees), *_center(center)))
+
+    def then(self, other: "AffineTransform") -> "AffineTransform":
+        # apply self, then other
+        return self._then(other.matrix)
+
+    def __matmul__(self, other: "AffineTransform") -> "AffineTransform":
+        # matrix order: (self @ other) applies other first
+        return other.then(self)
+
+    @property
+    def matrix(self) -> np.ndarray:
+        if self._matrix is None:
+            m = np.eye(3)
+            for step in self._steps:
+                m = step @ m
+            self._matrix = _frozen(m)
+            self._steps = ()
+        return self._matrix
+
+    @property
+    def coefficients(self) -> Tuple[float, float, float, float, float, float]:
+        # (a, b, tx, c, d, ty) as Python floats for the scalar fast path
+        if self._coef is None:
+            self._coef = tuple(self.matrix[:2].ravel().tolist())
+        return self._coef
+
+    def determinant(self) -> float:
+        a, b, _, c, d, _ = self.coefficients
+        return a * d - b * c
+
+    def _scale2(self) -> float:
+        # squared Frobenius norm of the linear part; det and the similarity
+        # residuals grow with it, so tolerances are taken relative to it
+        a, b, _, c, d, _ = self.coefficients
+        return a*a + b*b + c*c + d*d
+
+    def inverse(self) -> "AffineTransform":
+        if self._inverse is None:
+            if abs(self.determinant()) <= EPS * self._scale2():
+                raise ValueError("Transform is not invertible")
+            inv = AffineTransform(np.linalg.inv(self.matrix))
+            inv._inverse = self
+            self._inverse = inv
+        return self._inverse
+
+    def is_similarity(self) -> bool:
+        # rotation/reflection times a uniform scale: maps circles to circles
+        a, b, _, c, d, _ = self.coefficients
+        tol = EPS * self._scale2()
+        return abs(a*a + c*c - (b*b + d*d)) <= tol and abs(a*b + c*d) <= tol
+
+    # ---------------------------
+    # Application
+    # ---------------------------
+
+    def apply_coords(self, coords: np.ndarray) -> np.ndarray:
+        """Maps a (2, ...) coordinate buffer with one matrix multiply."""
+        m = self.matrix
+        coords = np.asarray(coords, dtype=float)
+        flat = coords.reshape(2, -1)
+        return (m[:2, :2] @ flat + m[:2, 2:]).reshape(coords.shape)
+
+    def apply_points(self, xy) -> np.ndarray:
+        """Maps an (n, 2) array of points, returns (n, 2)."""
+        xy = np.asarray(xy, dtype=float)
+        m = self.matrix
+        return xy @ m[:2, :2].T + m[:2, 2]
+
+    def _point(self, p: Point) -> Point:
+        a, b, tx, c, d, ty = self.coefficients
+        return Point(a * p.x + b * p.y + tx, c * p.x + d * p.y + ty)
+
+    def _radius(self, r):
+        if not self.is_similarity():
+            raise ValueError("Circles only stay circles under a similarity transform")
+        return r * math.sqrt(abs(self.determinant()))
+
+    def __call__(self, obj):
+        """
+        Applies the transform to a Point, Line, Circle, Triangle, one of the
+        GeometryArrays containers, or an (n, 2) ndarray.
+        """
+        if isinstance(obj, Point):
+            return self._point(obj)
+        if isinstance(obj, Triangle):
+            return Triangle(self._point(obj.p1), self._point(obj.p2), self._point(obj.p3))
+        if isinstance(obj, Circle):
+            return Circle(self._point(obj.center), self._radius(obj.r))
+        if isinstance(obj, Line):
+            # l' = l M^-1 keeps l' (M x) = l x = 0
+            A, B, C = (np.array([obj.A, obj.B, obj.C]) @ self.inverse().matrix).tolist()
+            return Line(A, B, C)
+        if isinstance(obj, PointArray):
+            return PointArray._wrap(self.apply_coords(obj.coords))
+        if isinstance(obj, TriangleArray):
+            t = TriangleArray.__new__(TriangleArray)
+            t.vertices = self.apply_coords(obj.vertices.transpose(1, 0, 2)).transpose(1, 0, 2).copy()
+            return t
+        if isinstance(obj, CircleArray):
+            return CircleArray(self(obj.center), self._radius(obj.r))
+        if isinstance(obj, LineArray):
+            coef = self.inverse().matrix.T @ obj.coef
+            return LineArray(*coef)
+        if isinstance(obj, np.ndarray):
+            return self.apply_points(obj)
+        raise TypeError(f"Cannot transform {type(obj).__name__}")
+
+    def apply_many(self, shapes: List[Shape]) -> List[Shape]:
+        """
+        Transforms a list of Points, Circles and Triangles with a single matrix
+        multiply over all their vertices, then rebuilds the shapes.
+        """
+        xs, ys = [], []
+        for s in shapes:
+            if isinstance(s, Point):
+                xs.append(s.x); ys.append(s.y)
+            elif isinstance(s, Circle):
+                xs.append(s.center.x); ys.append(s.center.y)
+            elif isinstance(s, Triangle):
+                xs += (s.p1.x, s.p2.x, s.p3.x); ys += (s.p1.y, s.p2.y, s.p3.y)
+            else:
+                raise TypeError(f"Cannot batch-transform {type(s).__name__}")
+        out = self.apply_coords(np.array([xs, ys]))
+        pts = [Point(x, y) for x, y in zip(out[0].tolist(), out[1].tolist())]
+
+        result, k = [], 0
+        for s in shapes:
+            if isinstance(s, Point):
+                result.append(pts[k]); k += 1
+            elif isinstance(s, Circle):
+                result.append(Circle(pts[k], self._radius(s.r))); k += 1
+            else:
+                result.append(Triangle(pts[k], pts[k+1], pts[k+2])); k += 3
+        return result
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, AffineTransform) and np.allclose(self.matrix, other.matrix, atol=EPS)
+
+    def __repr__(self) -> str:
+        a, b, tx, c, d, ty = self.coefficients
+        return f"AffineTransform([[{a:.6f}, {b:.6f}, {tx:.6f}], [{c:.6f}, {d:.6f}, {ty:.6f}]])"
+
+# ---------------------------
+# Example usage in main
+# ---------------------------
+if __name__ == "__main__":
+    pivot = Point(1, 1)
+    T = AffineTransform().translate(2, 3).scale(2, center=pivot).rotate(30, center=pivot)
+    print(T)
+
+    tri = Triangle(Point(0, 0), Point(3, 0), Point(3, 4))
+    chained = tri.translate(2, 3).scale(2, center=pivot).rotate(30, center=pivot)
+    composed = T(tri)
+    for p, q in zip((chained.p1, chained.p2, chained.p3), (composed.p1, composed.p2, composed.p3)):
+        assert p.distance_to(q) < 1e-9
+    print("Chained:", chained)
+    print("Composed:", composed)
+    print("Round trip:", T.inverse()(composed))
+
+    # lines map so that transformed points stay on the transformed line
+    line = Line.from_points(Point(0, 0), Point(1, 2))
+    assert abs(T(line).evaluate(T(Point(1, 2)))) < 1e-9
+    circle = Circle(Point(1, 0), 2)
+    assert T(circle).center.distance_to(T(Point(1, 0))) < 1e-9 and abs(T(circle).r - 4) < 1e-9
+
+    # animation loop: the same transform applied to many shapes per frame
+    rng = np.random.default_rng(0)
+    n = 5000
+    tris = TriangleArray(*(PointArray(rng.uniform(-50, 50, n), rng.uniform(-50, 50, n)) for _ in range(3)))
+    shapes = tris.to_triangles()
+
+    start = time.perf_counter()
+    chained = [t.translate(2, 3).scale(2, center=pivot).rotate(30, center=pivot) for t in shapes]
+    t_chain = time.perf_counter() - start
+    start = time.perf_counter()
+    single = [T(t) for t in shapes]
+    t_single = time.perf_counter() - start
+    start = time.perf_counter()
+    many = T.apply_many(shapes)
+    t_many = time.perf_counter() - start
+    start = time.perf_counter()
+    batch = T(tris)
+    t_batch = time.perf_counter() - start
+
+    assert np.allclose(TriangleArray.from_triangles(chained).vertices, batch.vertices)
+    assert np.allclose(TriangleArray.from_triangles(many).vertices, batch.vertices)
+    print(f"{n} triangles per frame: chained methods {t_chain*1000:.1f}ms, "
+          f"T(shape) {t_single*1000:.1f}ms, apply_many {t_many*1000:.1f}ms, TriangleArray {t_batch*1000:.2f}ms")
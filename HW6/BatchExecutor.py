@@ -0,0 +1,181 @@
+from __future__ import annotations
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Callable, List, Optional, Sequence, Tuple
+import numpy as np
+
+from IntersectionKernels import intersect_circles_batch, intersect_line_circle_batch
+
+# (shared memory name, shape, dtype string): all a worker needs to map an array
+Spec = Tuple[str, Tuple[int, ...], str]
+
+# ---------------------------
+# Shared-memory arrays
+# ---------------------------
+
+def _share(shape: Tuple[int, ...], dtype, source: Optional[np.ndarray] = None):
+    dtype = np.dtype(dtype)
+    shm = shared_memory.SharedMemory(create=True, size=max(1, int(np.prod(shape)) * dtype.itemsize))
+    array = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+    if source is not None:
+        array[...] = source
+    return shm, array, (shm.name, tuple(shape), dtype.str)
+
+def _attach(spec: Spec):
+    name, shape, dtype = spec
+    shm = shared_memory.SharedMemory(name=name)
+    return shm, np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+
+def _run_chunk(kernel: Callable, inputs: List[Spec], outputs: List[Spec], start: int, stop: int, args):
+    # worker side: map the buffers, run the kernel on rows start:stop, write in place
+    handles = [_attach(spec) for spec in inputs + outputs]
+    try:
+        arrays = [a[start:stop] for _, a in handles]
+        kernel(arrays[:len(inputs)], arrays[len(inputs):], *args)
+    finally:
+        del arrays
+        for shm, _ in handles:
+            shm.close()
+
+# ---------------------------
+# Kernels: fn(inputs, outputs, *args) over one chunk of rows
+# ---------------------------
+
+def _circles_kernel(inputs, outputs):
+    outputs[0][:], outputs[1][:] = intersect_circles_batch(*inputs)
+
+def _line_circle_kernel(inputs, outputs):
+    outputs[0][:], outputs[1][:] = intersect_line_circle_batch(*inputs)
+
+def _transform_kernel(inputs, outputs, matrix):
+    np.matmul(inputs[0], matrix[:2, :2].T, out=outputs[0])
+    outputs[0] += matrix[:2, 2]
+
+def _triangle_area_kernel(inputs, outputs):
+    # shoelace formula on (n, 3, 2) vertices
+    (x1, y1), (x2, y2), (x3, y3) = inputs[0].transpose(1, 2, 0)
+    outputs[0][:] = np.abs((x1*(y2-y3) + x2*(y3-y1) + x3*(y1-y2)) / 2.0)
+
+# ---------------------------
+# BatchExecutor
+# ---------------------------
+class BatchExecutor:
+    """
+    Runs array kernels over row chunks in a process pool. Inputs are copied
+    once into multiprocessing.shared_memory, workers receive only the block
+    names and a row range, and every worker writes straight into one shared
+    output buffer, so no coordinate data is pickled in either direction.
+    Inputs no larger than one chunk run in the calling process.
+    """
+
+    def __init__(self, workers: Optional[int] = None, chunk_size: int = 1 << 16):
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be positive")
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def __enter__(self) -> "BatchExecutor":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def map(self, kernel: Callable, inputs: Sequence[np.ndarray],
+            outputs: Sequence[Tuple[Tuple[int, ...], object]], *args) -> List[np.ndarray]:
+        """
+        Applies kernel(inputs, outputs, *args) to every chunk of rows.
+        inputs: arrays sharing their first dimension n.
+        outputs: (trailing shape, dtype) of each result; results are (n, *shape).
+        kernel must be a module-level function so workers can import it.
+        """
+        inputs = [np.ascontiguousarray(a) for a in inputs]
+        n = len(inputs[0])
+        if any(len(a) != n for a in inputs):
+            raise ValueError("All inputs must have the same number of rows")
+        if self.workers == 1 or n <= self.chunk_size:
+            results = [np.empty((n,) + tuple(shape), dtype=dtype) for shape, dtype in outputs]
+            kernel(inputs, results, *args)
+            return results
+
+        blocks = [_share(a.shape, a.dtype, a) for a in inputs]
+        blocks += [_share((n,) + tuple(shape), dtype) for shape, dtype in outputs]
+        try:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(max_workers=self.workers)
+            specs = [spec for _, _, spec in blocks]
+            in_specs, out_specs = specs[:len(inputs)], specs[len(inputs):]
+            futures = [self._pool.submit(_run_chunk, kernel, in_specs, out_specs,
+                                         start, min(start + self.chunk_size, n), args)
+                       for start in range(0, n, self.chunk_size)]
+            for f in futures:
+                f.result()
+            return [array.copy() for _, array, _ in blocks[len(inputs):]]
+        finally:
+            for shm, array, _ in blocks:
+                del array
+                shm.close()
+                shm.unlink()
+
+    # ---------------------------
+    # HW6 jobs
+    # ---------------------------
+
+    def intersect_circles(self, centers0, r0, centers1, r1):
+        """Parallel intersect_circles_batch; returns (status, points)."""
+        n = len(centers0)
+        inputs = [np.asarray(centers0, float), np.broadcast_to(np.asarray(r0, float), (n,)),
+                  np.asarray(centers1, float), np.broadcast_to(np.asarray(r1, float), (n,))]
+        return tuple(self.map(_circles_kernel, inputs, [((), np.int64), ((2, 2), float)]))
+
+    def intersect_line_circle(self, coef, centers, r):
+        """Parallel intersect_line_circle_batch; returns (status, points)."""
+        n = len(coef)
+        inputs = [np.asarray(coef, float), np.asarray(centers, float), np.broadcast_to(np.asarray(r, float), (n,))]
+        return tuple(self.map(_line_circle_kernel, inputs, [((), np.int64), ((2, 2), float)]))
+
+    def transform(self, transform, xy) -> np.ndarray:
+        """Applies an AffineTransform (or a 3x3 matrix) to (n, 2) points."""
+        matrix = np.asarray(getattr(transform, "matrix", transform), dtype=float)
+        return self.map(_transform_kernel, [np.asarray(xy, float)], [((2,), float)], matrix)[0]
+
+    def triangle_areas(self, vertices) -> np.ndarray:
+        """Areas of (n, 3, 2) triangle vertices."""
+        return self.map(_triangle_area_kernel, [np.asarray(vertices, float)], [((), float)])[0]
+
+# ---------------------------
+# Example usage in main
+# ---------------------------
+if __name__ == "__main__":
+    from AffineTransform import AffineTransform
+
+    rng = np.random.default_rng(0)
+    n = 2_000_000
+    c0, c1 = rng.uniform(-10, 10, (n, 2)), rng.uniform(-10, 10, (n, 2))
+    r0, r1 = rng.uniform(1, 8, n), rng.uniform(1, 8, n)
+
+    start = time.perf_counter()
+    status_1, points_1 = intersect_circles_batch(c0, r0, c1, r1)
+    t_single = time.perf_counter() - start
+
+    with BatchExecutor(chunk_size=1 << 17) as executor:
+        start = time.perf_counter()
+        status, points = executor.intersect_circles(c0, r0, c1, r1)
+        t_pool = time.perf_counter() - start
+        assert np.array_equal(status, status_1) and np.array_equal(points, points_1, equal_nan=True)
+
+        T = AffineTransform().rotate(30).translate(5, -2).scale(1.5)
+        moved = executor.transform(T, c0)
+        assert np.allclose(moved, T.apply_points(c0))
+
+        tris = rng.uniform(-1, 1, (n, 3, 2))
+        areas = executor.triangle_areas(tris)
+        print(f"{n} circle pairs on {executor.workers} worker(s), chunks of {executor.chunk_size}: "
+              f"single process {t_single:.2f}s, executor {t_pool:.2f}s; mean triangle area {areas.mean():.4f}")
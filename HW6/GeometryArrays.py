@@ -0,0 +1,409 @@
+from __future__ import annotations
+import math
+import time
+from typing import List, Optional, Union
+import numpy as np
+
+from HW6 import EPS, Point, Line, Circle, Triangle
+from Predicates import det2_batch
+
+# ---------------------------
+# Helper utilities
+# ---------------------------
+
+def _center(center: Optional[Point]):
+    return (0.0, 0.0) if center is None else (center.x, center.y)
+
+def _position(index, n: int) -> int:
+    # integer index as in a list: negatives count from the end, anything else out of range raises
+    i = int(index)
+    if i < 0:
+        i += n
+    if not 0 <= i < n:
+        raise IndexError(f"index {int(index)} out of range for length {n}")
+    return i
+
+def _rotation(angle_degrees):
+    theta = np.radians(angle_degrees)
+    return np.cos(theta), np.sin(theta)
+
+# ---------------------------
+# PointArray: x and y in one (2, n) float64 buffer
+# ---------------------------
+class PointArray:
+    __slots__ = ("coords",)
+
+    def __init__(self, x, y):
+        x, y = np.broadcast_arrays(np.asarray(x, dtype=float), np.asarray(y, dtype=float))
+        self.coords = np.ascontiguousarray(np.stack([x.ravel(), y.ravel()]))
+
+    @classmethod
+    def _wrap(cls, coords: np.ndarray) -> "PointArray":
+        # share an existing (2, n) buffer without copying
+        self = cls.__new__(cls)
+        self.coords = coords
+        return self
+
+    @classmethod
+    def from_points(cls, points: List[Point]) -> "PointArray":
+        return cls([p.x for p in points], [p.y for p in points])
+
+    @classmethod
+    def from_array(cls, xy) -> "PointArray":
+        xy = np.asarray(xy, dtype=float)
+        return cls(xy[:, 0], xy[:, 1])
+
+    @property
+    def x(self) -> np.ndarray:
+        return self.coords[0]
+
+    @property
+    def y(self) -> np.ndarray:
+        return self.coords[1]
+
+    def __len__(self) -> int:
+        return self.coords.shape[1]
+
+    def __getitem__(self, index) -> Union["PointView", "PointArray"]:
+        if isinstance(index, (int, np.integer)):
+            return PointView(self, _position(index, len(self)))
+        return PointArray._wrap(self.coords[:, index])
+
+    def distance_to(self, other: Union[Point, "PointArray"]) -> np.ndarray:
+        return np.hypot(self.x - other.x, self.y - other.y)
+
+    def translate(self, dx, dy) -> "PointArray":
+        return PointArray(self.x + dx, self.y + dy)
+
+    def scale(self, sx, sy=None, center: Optional[Point] = None) -> "PointArray":
+        if sy is None:
+            sy = sx
+        cx, cy = _center(center)
+        return PointArray(cx + sx * (self.x - cx), cy + sy * (self.y - cy))
+
+    def rotate(self, angle_degrees, center: Optional[Point] = None) -> "PointArray":
+        cx, cy = _center(center)
+        cos_t, sin_t = _rotation(angle_degrees)
+        dx = self.x - cx
+        dy = self.y - cy
+        return PointArray(cx + dx * cos_t - dy * sin_t, cy + dx * sin_t + dy * cos_t)
+
+    def as_array(self) -> np.ndarray:
+        # (n, 2) copy, one row per point
+        return self.coords.T.copy()
+
+    def to_points(self) -> List[Point]:
+        return [Point(x, y) for x, y in zip(self.x.tolist(), self.y.tolist())]
+
+    def __repr__(self) -> str:
+        return f"PointArray(n={len(self)})"
+
+# ---------------------------
+# LineArray: A, B, C in one (3, n) buffer
+# ---------------------------
+class LineArray:
+    __slots__ = ("coef",)
+
+    def __init__(self, A, B, C):
+        A, B, C = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (A, B, C)))
+        self.coef = np.ascontiguousarray(np.stack([A.ravel(), B.ravel(), C.ravel()]))
+
+    @classmethod
+    def from_points(cls, p1: PointArray, p2: PointArray) -> "LineArray":
+        A = p2.y - p1.y
+        B = -(p2.x - p1.x)
+        C = (p2.x - p1.x) * p1.y - (p2.y - p1.y) * p1.x
+        return cls(A, B, C)
+
+    @classmethod
+    def from_lines(cls, lines: List[Line]) -> "LineArray":
+        return cls([l.A for l in lines], [l.B for l in lines], [l.C for l in lines])
+
+    A = property(lambda self: self.coef[0])
+    B = property(lambda self: self.coef[1])
+    C = property(lambda self: self.coef[2])
+
+    def __len__(self) -> int:
+        return self.coef.shape[1]
+
+    def __getitem__(self, index) -> Union["LineView", "LineArray"]:
+        if isinstance(index, (int, np.integer)):
+            return LineView(self, _position(index, len(self)))
+        lines = LineArray.__new__(LineArray)
+        lines.coef = self.coef[:, index]
+        return lines
+
+    def evaluate(self, p: Union[Point, PointArray]) -> np.ndarray:
+        return self.A * p.x + self.B * p.y + self.C
+
+    def is_parallel(self, other: "LineArray") -> np.ndarray:
+        # same exact sign test as Line.is_parallel, one row at a time only when the filter fails
+        return det2_batch(self.A, self.B, other.A, other.B) == 0
+
+    def direction_vectors(self) -> np.ndarray:
+        return np.stack([-self.B, self.A])
+
+    def normalize(self) -> "LineArray":
+        norm = np.hypot(self.A, self.B)
+        norm = np.where(norm < EPS, 1.0, norm)
+        A, B, C = self.A / norm, self.B / norm, self.C / norm
+        flip = (A < -EPS) | ((np.abs(A) <= EPS) & (B < -EPS))
+        sign = np.where(flip, -1.0, 1.0)
+        return LineArray(A * sign, B * sign, C * sign)
+
+    def translate(self, dx, dy) -> "LineArray":
+        return LineArray(self.A, self.B, self.C - self.A * dx - self.B * dy)
+
+    def to_lines(self) -> List[Line]:
+        return [Line(a, b, c) for a, b, c in zip(*self.coef.tolist())]
+
+    def __repr__(self) -> str:
+        return f"LineArray(n={len(self)})"
+
+# ---------------------------
+# CircleArray: centers and radii
+# ---------------------------
+class CircleArray:
+    __slots__ = ("center", "r")
+
+    def __init__(self, center: PointArray, r):
+        self.center = center
+        self.r = np.array(np.broadcast_to(np.asarray(r, dtype=float), (len(center),)))
+
+    @classmethod
+    def _wrap(cls, center: PointArray, r: np.ndarray) -> "CircleArray":
+        self = cls.__new__(cls)
+        self.center = center
+        self.r = r
+        return self
+
+    @classmethod
+    def from_circles(cls, circles: List[Circle]) -> "CircleArray":
+        return cls(PointArray.from_points([c.center for c in circles]), [c.r for c in circles])
+
+    def __len__(self) -> int:
+        return len(self.r)
+
+    def __getitem__(self, index) -> Union["CircleView", "CircleArray"]:
+        if isinstance(index, (int, np.integer)):
+            return CircleView(self, _position(index, len(self)))
+        return CircleArray._wrap(self.center[index], self.r[index])
+
+    def translate(self, dx, dy) -> "CircleArray":
+        return CircleArray(self.center.translate(dx, dy), self.r)
+
+    def scale(self, s, center: Optional[Point] = None) -> "CircleArray":
+        return CircleArray(self.center.scale(s, center=center), np.abs(self.r * s))
+
+    def rotate(self, angle_degrees, center: Optional[Point] = None) -> "CircleArray":
+        return CircleArray(self.center.rotate(angle_degrees, center), self.r)
+
+    def area(self) -> np.ndarray:
+        return math.pi * self.r * self.r
+
+    def to_circles(self) -> List[Circle]:
+        return [Circle(p, r) for p, r in zip(self.center.to_points(), self.r.tolist())]
+
+    def __repr__(self) -> str:
+        return f"CircleArray(n={len(self)})"
+
+# ---------------------------
+# TriangleArray: three PointArrays sharing one (3, 2, n) buffer
+# ---------------------------
+TRIANGLE_TYPES = np.array(["equilateral", "isosceles right", "right", "isosceles", "scalene"])
+
+class TriangleArray:
+    __slots__ = ("vertices",)
+
+    def __init__(self, p1: PointArray, p2: PointArray, p3: PointArray):
+        self.vertices = np.ascontiguousarray(np.stack([p1.coords, p2.coords, p3.coords]))
+
+    @classmethod
+    def _wrap(cls, vertices: np.ndarray) -> "TriangleArray":
+        # share an existing (3, 2, n) buffer without copying
+        self = cls.__new__(cls)
+        self.vertices = vertices
+        return self
+
+    @classmethod
+    def from_triangles(cls, triangles: List[Triangle]) -> "TriangleArray":
+        return cls(PointArray.from_points([t.p1 for t in triangles]),
+                   PointArray.from_points([t.p2 for t in triangles]),
+                   PointArray.from_points([t.p3 for t in triangles]))
+
+    p1 = property(lambda self: PointArray._wrap(self.vertices[0]))
+    p2 = property(lambda self: PointArray._wrap(self.vertices[1]))
+    p3 = property(lambda self: PointArray._wrap(self.vertices[2]))
+
+    def __len__(self) -> int:
+        return self.vertices.shape[2]
+
+    def __getitem__(self, index) -> Union["TriangleView", "TriangleArray"]:
+        if isinstance(index, (int, np.integer)):
+            return TriangleView(self, _position(index, len(self)))
+        return TriangleArray._wrap(self.vertices[..., index])
+
+    def side_lengths(self) -> np.ndarray:
+        # (3, n): opposite p1, p2, p3, like Triangle.side_lengths
+        return np.stack([self.p2.distance_to(self.p3),
+                         self.p1.distance_to(self.p3),
+                         self.p1.distance_to(self.p2)])
+
+    def perimeter(self) -> np.ndarray:
+        return self.side_lengths().sum(axis=0)
+
+    def area(self) -> np.ndarray:
+        # shoelace formula
+        (x1, y1), (x2, y2), (x3, y3) = self.vertices
+        return np.abs((x1*(y2-y3) + x2*(y3-y1) + x3*(y1-y2)) / 2.0)
+
+    def triangle_type(self) -> np.ndarray:
+        a_s, b_s, c_s = np.sort(self.side_lengths(), axis=0)
+        equilateral = (np.abs(a_s - b_s) <= EPS) & (np.abs(b_s - c_s) <= EPS)
+        isosceles = (np.abs(a_s - b_s) <= EPS) | (np.abs(b_s - c_s) <= EPS) | (np.abs(a_s - c_s) <= EPS)
+        right = np.abs(a_s*a_s + b_s*b_s - c_s*c_s) <= EPS
+        # same precedence as Triangle.triangle_type
+        kind = np.select([equilateral, right & isosceles, right, isosceles], [0, 1, 2, 3], default=4)
+        return TRIANGLE_TYPES[kind]
+
+    def translate(self, dx, dy) -> "TriangleArray":
+        return TriangleArray(self.p1.translate(dx, dy), self.p2.translate(dx, dy), self.p3.translate(dx, dy))
+
+    def scale(self, sx, sy=None, center: Optional[Point] = None) -> "TriangleArray":
+        return TriangleArray(self.p1.scale(sx, sy, center), self.p2.scale(sx, sy, center), self.p3.scale(sx, sy, center))
+
+    def rotate(self, angle_degrees, center: Optional[Point] = None) -> "TriangleArray":
+        return TriangleArray(self.p1.rotate(angle_degrees, center), self.p2.rotate(angle_degrees, center), self.p3.rotate(angle_degrees, center))
+
+    def to_triangles(self) -> List[Triangle]:
+        return [Triangle(a, b, c) for a, b, c in zip(self.p1.to_points(), self.p2.to_points(), self.p3.to_points())]
+
+    def __repr__(self) -> str:
+        return f"TriangleArray(n={len(self)})"
+
+# ---------------------------
+# Views: scalar objects backed by one slot of an array
+# ---------------------------
+# Each view subclasses the scalar class, so every existing method and global
+# function accepts it; reads and writes go straight to the array buffer.
+
+class PointView(Point):
+    __slots__ = ("_array", "_index")
+
+    def __init__(self, array: PointArray, index: int):
+        self._array = array
+        self._index = index
+
+    def _get_x(self) -> float:
+        return float(self._array.coords[0, self._index])
+
+    def _set_x(self, value: float):
+        self._array.coords[0, self._index] = value
+
+    def _get_y(self) -> float:
+        return float(self._array.coords[1, self._index])
+
+    def _set_y(self, value: float):
+        self._array.coords[1, self._index] = value
+
+    x = property(_get_x, _set_x)
+    y = property(_get_y, _set_y)
+
+class LineView(Line):
+    __slots__ = ("_array", "_index")
+
+    def __init__(self, array: LineArray, index: int):
+        self._array = array
+        self._index = index
+
+    def _coef(row: int):
+        def get(self) -> float:
+            return float(self._array.coef[row, self._index])
+        def set(self, value: float):
+            self._array.coef[row, self._index] = value
+        return property(get, set)
+
+    A = _coef(0)
+    B = _coef(1)
+    C = _coef(2)
+    del _coef
+
+class CircleView(Circle):
+    __slots__ = ("_array", "_index")
+
+    def __init__(self, array: CircleArray, index: int):
+        self._array = array
+        self._index = index
+
+    @property
+    def center(self) -> PointView:
+        return PointView(self._array.center, self._index)
+
+    @center.setter
+    def center(self, p: Point):
+        self._array.center.coords[:, self._index] = (p.x, p.y)
+
+    @property
+    def r(self) -> float:
+        return float(self._array.r[self._index])
+
+    @r.setter
+    def r(self, value: float):
+        self._array.r[self._index] = value
+
+class TriangleView(Triangle):
+    __slots__ = ("_array", "_index")
+
+    def __init__(self, array: TriangleArray, index: int):
+        self._array = array
+        self._index = index
+
+    def _vertex(k: int):
+        def get(self) -> PointView:
+            return PointView(PointArray._wrap(self._array.vertices[k]), self._index)
+        def set(self, p: Point):
+            self._array.vertices[k, :, self._index] = (p.x, p.y)
+        return property(get, set)
+
+    p1 = _vertex(0)
+    p2 = _vertex(1)
+    p3 = _vertex(2)
+    del _vertex
+
+# ---------------------------
+# Example usage in main
+# ---------------------------
+if __name__ == "__main__":
+    A = Point(0, 0)
+    B = Point(3, 0)
+    C = Point(3, 4)
+    tris = TriangleArray.from_triangles([Triangle(A, B, C), Triangle(A, B, Point(1.5, 1.5 * math.sqrt(3)))])
+    print("Areas:", tris.area())
+    print("Types:", tris.triangle_type())
+
+    # views behave like the scalar classes and write through to the buffer
+    t0 = tris[0]
+    print("View area:", t0.area(), "type:", t0.triangle_type())
+    t0.p3 = Point(0, 4)
+    print("After moving p3:", tris.area(), tris.triangle_type())
+
+    n = 1_000_000
+    rng = np.random.default_rng(0)
+    pts = PointArray(rng.uniform(-100, 100, n), rng.uniform(-100, 100, n))
+    scalar = pts[:100_000].to_points()
+
+    start = time.perf_counter()
+    rotated = [p.rotate(30, center=A) for p in scalar]
+    t_scalar = (time.perf_counter() - start) * n / len(scalar)
+
+    start = time.perf_counter()
+    rotated_array = pts.rotate(30, center=A)
+    t_array = time.perf_counter() - start
+
+    assert np.allclose(rotated_array[:100_000].as_array(), [p.as_tuple() for p in rotated])
+    print(f"rotate {n} points: Point loop ~{t_scalar:.2f}s (extrapolated), PointArray {t_array:.4f}s")
+
+    # is_parallel agrees with the exact scalar test, at micro scale and on near-parallel lines
+    l1 = LineArray.from_points(PointArray([0, 0, 0], [0, 0, 0]), PointArray([1e-5, 1.0, 3.0], [0, 1.0, 1.0]))
+    l2 = LineArray.from_points(PointArray([0, 0, 0], [0, 5, 0]), PointArray([0, 1.0, 3.0], [1e-5, 6.0, 1.0 + 1e-15]))
+    assert l1.is_parallel(l2).tolist() == [l1[i].is_parallel(l2[i]) for i in range(3)] == [False, True, False]
@@ -2,6 +2,8 @@ from __future__ import annotations
 import math
 from typing import Optional, Tuple, List
 
+from Predicates import det2, distance_sign, line_distance_sign
+
 EPS = 1e-9
 
 # ---------------------------
@@ -80,21 +82,21 @@ class Line:
         return cls(A, B, C)
 
     def is_parallel(self, other: "Line") -> bool:
-        # Two lines are parallel if their A,B are proportional
-        return almost_equal(self.A * other.B, self.B * other.A)
+        # Two lines are parallel if their A,B are proportional (exact sign test)
+        return det2(self.A, self.B, other.A, other.B) == 0
 
     def is_coincident(self, other: "Line") -> bool:
         # Coincident if parallel and C ratios match as well
-        return self.is_parallel(other) and almost_equal(self.A * other.C, self.C * other.A) and almost_equal(self.B * other.C, self.C * other.B)
+        return self.is_parallel(other) and det2(self.A, self.C, other.A, other.C) == 0 and det2(self.B, self.C, other.B, other.C) == 0
 
     def evaluate(self, p: Point) -> float:
         return self.A * p.x + self.B * p.y + self.C
 
     def intersection_with_line(self, other: "Line") -> Optional[Point]:
-        det = self.A * other.B - other.A * self.B
-        if almost_equal(det, 0.0):
+        if det2(self.A, self.B, other.A, other.B) == 0:
             # parallel or coincident
             return None
+        det = self.A * other.B - other.A * self.B
         x = (self.B * other.C - other.B * self.C) / det
         y = (other.A * self.C - self.A * other.C) / det
         return Point(x, y)
@@ -225,36 +227,37 @@ def intersect_circles(c1: Circle, c2: Circle) -> Tuple[str, List[Point]]:
     """
     Returns (status, points)
     status: "none", "one", "two", "coincident"
+    The status comes from exact sign tests (Predicates.py), so tangency and
+    containment are decided correctly at any coordinate scale.
     """
     x0, y0 = c1.center.as_tuple()
     x1, y1 = c2.center.as_tuple()
     r0 = c1.r
     r1 = c2.r
-    dx = x1 - x0
-    dy = y1 - y0
-    d = math.hypot(dx, dy)
 
-    if almost_equal(d, 0.0) and almost_equal(r0, r1):
+    if x0 == x1 and y0 == y1 and r0 == r1:
         return ("coincident", [])
-    if d > r0 + r1 + EPS:
-        return ("none", [])
-    if d < abs(r0 - r1) - EPS:
+    # compare d with r0 + r1 (outside) and |r0 - r1| (one inside the other)
+    outer = distance_sign(x0, y0, x1, y1, r0, r1)
+    inner = distance_sign(x0, y0, x1, y1, r0, -r1)
+    if outer > 0 or inner < 0:
         return ("none", [])
 
+    dx = x1 - x0
+    dy = y1 - y0
+    d = math.hypot(dx, dy)
     # compute a = distance from center0 to the line connecting intersection points
     # a = (r0^2 - r1^2 + d^2) / (2d)
     a = (r0*r0 - r1*r1 + d*d) / (2.0 * d)
     # height from that line to intersection points
     h_sq = r0*r0 - a*a
-    if h_sq < -EPS:
-        return ("none", [])
     h = math.sqrt(max(0.0, h_sq))
 
     # midpoint
     xm = x0 + a * dx / d
     ym = y0 + a * dy / d
 
-    if almost_equal(h, 0.0):
+    if outer == 0 or inner == 0:
         return ("one", [Point(xm, ym)])
 
     rx = -dy * (h / d)
@@ -270,21 +273,21 @@ def intersect_line_circle(line: Line, circle: Circle) -> Tuple[str, List[Point]]
     Return status and list of intersection points between an infinite line and a circle.
     status: "none", "one", "two"
     """
-    # distance from center to line
-    dist_num = abs(line.A * circle.center.x + line.B * circle.center.y + line.C)
-    denom = math.hypot(line.A, line.B)
-    if denom < EPS:
+    if line.A == 0 and line.B == 0:
         return ("none", [])
-    dist = dist_num / denom
-    if dist > circle.r + EPS:
+    # exact sign of (distance from center to line) - r
+    side = line_distance_sign(line.A, line.B, line.C, circle.center.x, circle.center.y, circle.r)
+    if side > 0:
         return ("none", [])
 
     # find foot of perpendicular
     foot = find_foot_of_perpendicular(circle.center, line)
 
-    if almost_equal(dist, circle.r):
+    if side == 0:
         return ("one", [foot])
 
+    dist = abs(line.evaluate(circle.center)) / math.hypot(line.A, line.B)
+
     # direction vector along the line
     dx, dy = line.direction_vector()
     dlen = math.hypot(dx, dy)
@@ -0,0 +1,177 @@
+from __future__ import annotations
+import time
+from typing import Tuple
+import numpy as np
+
+from HW6 import Point, Line, Circle, intersect_circles, intersect_line_circle
+from GeometryArrays import PointArray, LineArray, CircleArray
+from Predicates import distance_sign_batch, line_distance_sign_batch
+
+# Status codes, indexing into STATUS_NAMES (the strings the scalar functions return)
+NONE, ONE, TWO, COINCIDENT = 0, 1, 2, 3
+STATUS_NAMES = np.array(["none", "one", "two", "coincident"])
+
+# ---------------------------
+# Kernels
+# ---------------------------
+
+def intersect_circles_batch(centers0, r0, centers1, r1) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized intersect_circles over n circle pairs.
+    centers: (n, 2) arrays, r: (n,) arrays (broadcastable).
+    Returns (status, points): status is an (n,) int array of NONE/ONE/TWO/COINCIDENT,
+    points is (n, 2, 2) with unused slots set to nan ("one" fills slot 0).
+    The status uses the same exact sign tests as the scalar function; only
+    the few rows the float filter cannot decide fall back to Fractions.
+    """
+    c0 = np.asarray(centers0, dtype=float)
+    c1 = np.asarray(centers1, dtype=float)
+    r0 = np.asarray(r0, dtype=float)
+    r1 = np.asarray(r1, dtype=float)
+    x0, y0, x1, y1, r0, r1 = np.broadcast_arrays(c0[..., 0], c0[..., 1], c1[..., 0], c1[..., 1], r0, r1)
+
+    dx = x1 - x0
+    dy = y1 - y0
+    d = np.hypot(dx, dy)
+
+    coincident = (dx == 0) & (dy == 0) & (r0 == r1)
+    outer = distance_sign_batch(x0, y0, x1, y1, r0, r1)
+    inner = distance_sign_batch(x0, y0, x1, y1, r0, -r1)
+    none = ~coincident & ((outer > 0) | (inner < 0))
+    one = ~coincident & ~none & ((outer == 0) | (inner == 0))
+    two = ~coincident & ~none & ~one
+
+    d_safe = np.where(d == 0, 1.0, d)
+    a = (r0*r0 - r1*r1 + d*d) / (2.0 * d_safe)
+    h = np.sqrt(np.maximum(0.0, r0*r0 - a*a))
+
+    xm = x0 + a * dx / d_safe
+    ym = y0 + a * dy / d_safe
+    rx = np.where(one, 0.0, -dy * (h / d_safe))
+    ry = np.where(one, 0.0, dx * (h / d_safe))
+
+    status = np.select([coincident, none, one], [COINCIDENT, NONE, ONE], default=TWO)
+    points = np.full(status.shape + (2, 2), np.nan)
+    hit = one | two
+    points[hit, 0, 0] = (xm + rx)[hit]
+    points[hit, 0, 1] = (ym + ry)[hit]
+    points[two, 1, 0] = (xm - rx)[two]
+    points[two, 1, 1] = (ym - ry)[two]
+    return status, points
+
+def intersect_line_circle_batch(coef, centers, r) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized intersect_line_circle over n (line, circle) pairs.
+    coef: (n, 3) array of A, B, C; centers: (n, 2); r: (n,).
+    Returns (status, points) like intersect_circles_batch (never COINCIDENT).
+    """
+    coef = np.asarray(coef, dtype=float)
+    c = np.asarray(centers, dtype=float)
+    A, B, C, cx, cy, r = np.broadcast_arrays(coef[..., 0], coef[..., 1], coef[..., 2],
+                                             c[..., 0], c[..., 1], np.asarray(r, dtype=float))
+
+    value = A * cx + B * cy + C
+    denom = np.hypot(A, B)
+    degenerate = (A == 0) & (B == 0)
+    denom_safe = np.where(degenerate, 1.0, denom)
+    dist = np.abs(value) / denom_safe
+    side = line_distance_sign_batch(A, B, C, cx, cy, r)
+    none = degenerate | (side > 0)
+    one = ~none & (side == 0)
+    two = ~none & ~one
+
+    # foot of the perpendicular from the center
+    k = value / (denom_safe * denom_safe)
+    fx = cx - A * k
+    fy = cy - B * k
+    # unit direction (-B, A) along the line
+    ux = -B / denom_safe
+    uy = A / denom_safe
+    t = np.sqrt(np.maximum(0.0, r*r - dist*dist))
+
+    status = np.select([none, one], [NONE, ONE], default=TWO)
+    points = np.full(status.shape + (2, 2), np.nan)
+    points[one, 0, 0] = fx[one]
+    points[one, 0, 1] = fy[one]
+    points[two, 0, 0] = (fx + ux * t)[two]
+    points[two, 0, 1] = (fy + uy * t)[two]
+    points[two, 1, 0] = (fx - ux * t)[two]
+    points[two, 1, 1] = (fy - uy * t)[two]
+    return status, points
+
+# ---------------------------
+# Wrappers over the GeometryArrays containers
+# ---------------------------
+
+def intersect_circle_arrays(c1: CircleArray, c2: CircleArray) -> Tuple[np.ndarray, np.ndarray]:
+    return intersect_circles_batch(c1.center.coords.T, c1.r, c2.center.coords.T, c2.r)
+
+def intersect_line_circle_arrays(lines: LineArray, circles: CircleArray) -> Tuple[np.ndarray, np.ndarray]:
+    return intersect_line_circle_batch(lines.coef.T, circles.center.coords.T, circles.r)
+
+def intersect_circles_all_pairs(circles: CircleArray):
+    """
+    Every pair i < j of one CircleArray in a single pass (O(n^2) memory).
+    Returns (i, j, status, points).
+    """
+    i, j = np.triu_indices(len(circles), k=1)
+    centers = circles.center.coords.T
+    status, points = intersect_circles_batch(centers[i], circles.r[i], centers[j], circles.r[j])
+    return i, j, status, points
+
+# ---------------------------
+# Agreement check against the scalar functions
+# ---------------------------
+
+def _matches(status, points, scalar) -> bool:
+    name, pts = scalar
+    if STATUS_NAMES[status] != name:
+        return False
+    expected = np.array([p.as_tuple() for p in pts]).reshape(-1, 2)
+    return np.allclose(points[:len(expected)], expected, atol=1e-7) and np.all(np.isnan(points[len(expected):]))
+
+if __name__ == "__main__":
+    rng = np.random.default_rng(0)
+    n = 20000
+
+    # random pairs plus exact tangent, concentric and coincident cases
+    c0 = rng.integers(-5, 6, (n, 2)).astype(float)
+    c1 = rng.integers(-5, 6, (n, 2)).astype(float)
+    r0 = rng.integers(1, 6, n).astype(float)
+    r1 = rng.integers(1, 6, n).astype(float)
+    c1[:100] = c0[:100]
+    r1[:50] = r0[:50]
+    status, points = intersect_circles_batch(c0, r0, c1, r1)
+    circles0 = [Circle(Point(*c), r) for c, r in zip(c0.tolist(), r0.tolist())]
+    circles1 = [Circle(Point(*c), r) for c, r in zip(c1.tolist(), r1.tolist())]
+
+    start = time.perf_counter()
+    scalar = [intersect_circles(a, b) for a, b in zip(circles0, circles1)]
+    t_scalar = time.perf_counter() - start
+    start = time.perf_counter()
+    intersect_circles_batch(c0, r0, c1, r1)
+    t_batch = time.perf_counter() - start
+    assert all(_matches(s, p, e) for s, p, e in zip(status, points, scalar))
+    print(f"circle-circle: {n} pairs agree with intersect_circles "
+          f"({np.bincount(status, minlength=4)} none/one/two/coincident); "
+          f"scalar {t_scalar:.3f}s, batch {t_batch:.4f}s")
+
+    coef = rng.integers(-3, 4, (n, 3)).astype(float)
+    coef[:20, :2] = 0  # degenerate lines
+    status, points = intersect_line_circle_batch(coef, c0, r0)
+    lines = [Line(*row) for row in coef.tolist()]
+
+    start = time.perf_counter()
+    scalar = [intersect_line_circle(l, c) for l, c in zip(lines, circles0)]
+    t_scalar = time.perf_counter() - start
+    start = time.perf_counter()
+    intersect_line_circle_batch(coef, c0, r0)
+    t_batch = time.perf_counter() - start
+    assert all(_matches(s, p, e) for s, p, e in zip(status, points, scalar))
+    print(f"line-circle: {n} pairs agree with intersect_line_circle "
+          f"({np.bincount(status, minlength=3)} none/one/two); "
+          f"scalar {t_scalar:.3f}s, batch {t_batch:.4f}s")
+
+    ca = CircleArray(PointArray(c0[:500, 0], c0[:500, 1]), r0[:500])
+    i, j, status, _ = intersect_circles_all_pairs(ca)
+    print(f"all pairs of 500 circles: {len(i)} pairs, {np.count_nonzero(status == TWO)} with two points")
@@ -0,0 +1,305 @@
+from __future__ import annotations
+import math
+import pickle
+import time
+from typing import List, Tuple, Union
+import numpy as np
+
+from HW6 import Point
+from GeometryArrays import PointArray
+
+PointsLike = Union[List[Point], PointArray, np.ndarray]
+
+# query_radius works through this many query points at a time
+_CHUNK = 16384
+# candidate distances held at once while answering a block of kNN queries (~32 MB)
+_BUDGET = 1 << 22
+
+def _as_xy(points: PointsLike) -> np.ndarray:
+    if isinstance(points, PointArray):
+        return points.coords.T
+    if isinstance(points, np.ndarray):
+        return np.asarray(points, dtype=float).reshape(-1, 2)
+    return np.array([(p.x, p.y) for p in points], dtype=float).reshape(-1, 2)
+
+# ---------------------------
+# KD-tree
+# ---------------------------
+class KDTree:
+    """
+    Static 2D KD-tree stored as flat arrays: a complete binary tree with
+    median splits on alternating axes and buckets of at most `leafsize`
+    points. Nodes are numbered heap-style (children 2i+1, 2i+2), so the tree
+    holds no Python objects, pickles as plain arrays, and every query walks
+    all query points down the tree together, one level at a time.
+    """
+    __slots__ = ("data", "leafsize", "depth", "split", "lo", "hi", "leaf_points", "leaf_index")
+
+    def __init__(self, points: PointsLike, leafsize: int = 16):
+        xy = np.array(_as_xy(points), dtype=float)
+        n = len(xy)
+        if n == 0:
+            raise ValueError("KDTree needs at least one point")
+        if leafsize < 1:
+            raise ValueError("leafsize must be positive")
+        self.data = xy
+        self.leafsize = leafsize
+        self.depth = D = max(0, math.ceil(math.log2(n / leafsize)))
+        L = 1 << D
+        bounds = (np.arange(L + 1) * n) // L  # leaf j holds tree-order positions bounds[j]:bounds[j+1]
+
+        # level by level: sort every node's points along the level's axis,
+        # as one integer sort on (node, rank of the coordinate along the axis)
+        rank = np.empty((2, n), dtype=np.int64)
+        for axis in range(2):
+            rank[axis, np.argsort(xy[:, axis], kind="stable")] = np.arange(n)
+        order = np.arange(n)
+        self.split = np.zeros(max(L - 1, 0))
+        for level in range(D):
+            axis = level % 2
+            width = L >> level  # leaves per node at this level
+            node_start = bounds[::width]
+            node_of = np.repeat(np.arange(1 << level, dtype=np.int64), np.diff(node_start))
+            order = order[np.argsort(node_of * n + rank[axis, order], kind="stable")]
+            right_start = bounds[np.arange(1 << level) * width + width // 2]
+            self.split[(1 << level) - 1:(2 << level) - 1] = xy[order[right_start], axis]
+
+        # padded leaf buckets; unused slots hold inf and index n
+        pts = xy[order]
+        m = int(np.diff(bounds).max())
+        leaf_of = np.repeat(np.arange(L), np.diff(bounds))
+        slot = np.arange(n) - bounds[leaf_of]
+        self.leaf_points = np.full((L, m, 2), np.inf)
+        self.leaf_points[leaf_of, slot] = pts
+        self.leaf_index = np.full((L, m), n)
+        self.leaf_index[leaf_of, slot] = order
+
+        # bounding boxes, leaves first, then each parent from its two children
+        self.lo = np.empty((2 * L - 1, 2))
+        self.hi = np.empty((2 * L - 1, 2))
+        self.lo[L - 1:] = np.minimum.reduceat(pts, bounds[:-1], axis=0)
+        self.hi[L - 1:] = np.maximum.reduceat(pts, bounds[:-1], axis=0)
+        for level in range(D - 1, -1, -1):
+            nodes = np.arange((1 << level) - 1, (2 << level) - 1)
+            self.lo[nodes] = np.minimum(self.lo[2 * nodes + 1], self.lo[2 * nodes + 2])
+            self.hi[nodes] = np.maximum(self.hi[2 * nodes + 1], self.hi[2 * nodes + 2])
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __repr__(self) -> str:
+        return f"KDTree(n={len(self)}, leafsize={self.leafsize}, depth={self.depth})"
+
+    # ---------------------------
+    # Traversal
+    # ---------------------------
+
+    def _leaf_of(self, q: np.ndarray) -> np.ndarray:
+        node = np.zeros(len(q), dtype=np.intp)
+        for level in range(self.depth):
+            node = 2 * node + 1 + (q[:, level % 2] >= self.split[node])
+        return node - ((1 << self.depth) - 1)
+
+    def _leaves_near(self, q: np.ndarray, r2: np.ndarray):
+        """
+        (query, leaf) pairs for every leaf whose box is within sqrt(r2) of the
+        query, with the squared distances to the leaf's points. The pairs come
+        out grouped by query, in query order.
+        """
+        qx, qy = q[:, 0], q[:, 1]
+        lox, loy, hix, hiy = self.lo[:, 0], self.lo[:, 1], self.hi[:, 0], self.hi[:, 1]
+        qi = np.arange(len(q))
+        node = np.zeros(len(q), dtype=np.intp)
+        for _ in range(self.depth):
+            qi = np.repeat(qi, 2)
+            node = (2 * node + 1)[:, None] + np.array([0, 1])
+            node = node.ravel()
+            x, y = qx[qi], qy[qi]
+            dx = np.maximum(np.maximum(lox[node] - x, x - hix[node]), 0.0)
+            dy = np.maximum(np.maximum(loy[node] - y, y - hiy[node]), 0.0)
+            keep = dx * dx + dy * dy <= r2[qi]
+            qi, node = qi[keep], node[keep]
+        leaf = node - ((1 << self.depth) - 1)
+        diff = self.leaf_points[leaf] - q[qi, None, :]
+        return qi, leaf, (diff * diff).sum(axis=2)
+
+    def _seed_height(self, k: int) -> int:
+        # smallest subtree height whose every subtree holds at least k points
+        smallest = len(self) >> self.depth  # leaves hold floor(n / L) or one more
+        h = 0
+        while (smallest << h) < k and h < self.depth:
+            h += 1
+        return h
+
+    def _query_chunk(self, q: np.ndarray, k: int, h: int):
+        # the 2^h leaves of the query's height-h subtree hold at least k points
+        # (unless k > n), so their k-th distance is a finite first bound
+        L = 1 << self.depth
+        leaf = self._leaf_of(q)
+        first = (leaf >> h) << h
+        leaves = first[:, None] + np.arange(1 << h)
+        diff = self.leaf_points[leaves].reshape(len(q), -1, 2) - q[:, None, :]
+        d2 = (diff * diff).sum(axis=2)
+        seed_index = self.leaf_index[leaves].reshape(len(q), -1)
+        r2 = np.partition(d2, k - 1, axis=1)[:, k - 1] if k <= d2.shape[1] else np.full(len(q), np.inf)
+
+        # queries whose ball already lies inside that subtree's box are finished
+        r = np.sqrt(r2)
+        node = ((leaf + L) >> h) - 1
+        done = np.all((q - r[:, None] >= self.lo[node]) & (q + r[:, None] <= self.hi[node]), axis=1)
+        if done.all():
+            return self._best(d2, seed_index, k)
+        rest = np.nonzero(~done)[0]
+        dist, idx = self._best(d2[done], seed_index[done], k)
+        out_d = np.empty((len(q), k))
+        out_i = np.empty((len(q), k), dtype=np.intp)
+        out_d[done], out_i[done] = dist, idx
+        out_d[rest], out_i[rest] = self._query_traverse(q[rest], r2[rest], k)
+        return out_d, out_i
+
+    def _query_traverse(self, q: np.ndarray, r2: np.ndarray, k: int):
+        qi, leaf, d2 = self._leaves_near(q, r2)
+        cap = d2.shape[1]
+        counts = np.bincount(qi, minlength=len(q))
+        starts = np.concatenate([[0], np.cumsum(counts)])
+        dist = np.empty((len(q), k))
+        idx = np.empty((len(q), k), dtype=np.intp)
+        # scatter each query's candidate leaves into one padded row, in blocks
+        # of rows sized so the padded matrix stays within the budget
+        rows = max(1, _BUDGET // (int(counts.max()) * cap))
+        for s in range(0, len(q), rows):
+            e = min(s + rows, len(q))
+            a, b = starts[s], starts[e]
+            row = qi[a:b]
+            rank = np.arange(a, b) - starts[row]
+            width = int(counts[s:e].max())
+            D = np.full((e - s, width, cap), np.inf)
+            I = np.full(D.shape, len(self))
+            D[row - s, rank] = d2[a:b]
+            I[row - s, rank] = self.leaf_index[leaf[a:b]]
+            dist[s:e], idx[s:e] = self._best(D.reshape(e - s, width * cap), I.reshape(e - s, width * cap), k)
+        return dist, idx
+
+    def _best(self, D: np.ndarray, I: np.ndarray, k: int):
+        # the k smallest squared distances of every row, as sorted (dist, index)
+        width = D.shape[1]
+        if k < width:
+            part = np.argpartition(D, k - 1, axis=1)[:, :k]
+        else:
+            part = np.broadcast_to(np.arange(width), (len(D), width))
+        D, I = np.take_along_axis(D, part, axis=1), np.take_along_axis(I, part, axis=1)
+        order = np.argsort(D, axis=1, kind="stable")
+        dist = np.full((len(D), k), np.inf)
+        idx = np.full((len(D), k), len(self))
+        dist[:, :D.shape[1]] = np.sqrt(np.take_along_axis(D, order, axis=1))
+        idx[:, :D.shape[1]] = np.take_along_axis(I, order, axis=1)
+        return dist, idx
+
+    # ---------------------------
+    # Queries
+    # ---------------------------
+
+    def query(self, x: Union[Point, PointsLike], k: int = 1):
+        """
+        k nearest neighbours. For one Point returns (distance, index) (arrays
+        of length k when k > 1); for m points returns (m,) arrays, or (m, k)
+        when k > 1. Missing neighbours (k > n) have distance inf and index n.
+        """
+        single = isinstance(x, Point)
+        q = _as_xy([x] if single else x)
+        dist = np.empty((len(q), k))
+        idx = np.empty((len(q), k), dtype=np.intp)
+        # block size from the candidate width: the seed subtree's slots, with
+        # room for the neighbouring leaves a query ball usually reaches
+        h = self._seed_height(k)
+        chunk = max(1, _BUDGET // (8 * (self.leaf_points.shape[1] << h)))
+        for s in range(0, len(q), chunk):
+            dist[s:s+chunk], idx[s:s+chunk] = self._query_chunk(q[s:s+chunk], k, h)
+        if k == 1:
+            dist, idx = dist[:, 0], idx[:, 0]
+        if single:
+            return (float(dist[0]), int(idx[0])) if k == 1 else (dist[0], idx[0])
+        return dist, idx
+
+    def query_radius(self, x: Union[Point, PointsLike], r) -> Union[np.ndarray, List[np.ndarray]]:
+        """
+        Indices of all points within distance r (inclusive), nearest first.
+        One Point gives an array; m points give a list of m arrays. r may be
+        a scalar or one radius per query point.
+        """
+        single = isinstance(x, Point)
+        q = _as_xy([x] if single else x)
+        r2 = np.broadcast_to(np.asarray(r, dtype=float) ** 2, (len(q),))
+        result = []
+        for s in range(0, len(q), _CHUNK):
+            block = q[s:s+_CHUNK]
+            qi, leaf, d2 = self._leaves_near(block, r2[s:s+_CHUNK])
+            qq = np.repeat(qi, d2.shape[1])
+            dd, ii = d2.ravel(), self.leaf_index[leaf].ravel()
+            inside = dd <= r2[s:s+_CHUNK][qq]
+            qq, dd, ii = qq[inside], dd[inside], ii[inside]
+            order = np.lexsort((dd, qq))
+            result += np.split(ii[order], np.searchsorted(qq[order], np.arange(1, len(block))))
+        return result[0] if single else result
+
+    def closest_pair(self) -> Tuple[int, int, float]:
+        """(i, j, distance) of the two closest stored points, i < j."""
+        if len(self) < 2:
+            raise ValueError("closest_pair needs at least two points")
+        dist, idx = self.query(self.data, k=2)
+        own = np.arange(len(self))
+        # with duplicates the point itself may come second
+        other = np.where(idx[:, 0] == own, idx[:, 1], idx[:, 0])
+        d = np.where(idx[:, 0] == own, dist[:, 1], dist[:, 0])
+        a = int(np.argmin(d))
+        i, j = sorted((a, int(other[a])))
+        return i, j, float(d[a])
+
+# ---------------------------
+# Example usage in main
+# ---------------------------
+if __name__ == "__main__":
+    pts = [Point(0, 0), Point(3, 4), Point(1, 1), Point(5, 5), Point(1.2, 0.9)]
+    tree = KDTree(pts, leafsize=2)
+    print(tree)
+    print("nearest to (1, 0):", tree.query(Point(1, 0)))
+    print("2 nearest to (4, 4):", tree.query(Point(4, 4), k=2))
+    print("within 1.5 of (1, 1):", tree.query_radius(Point(1, 1), 1.5))
+    print("closest pair:", tree.closest_pair())
+
+    rng = np.random.default_rng(0)
+    n = 1_000_000
+    data = rng.uniform(0, 1000, (n, 2))
+    start = time.perf_counter()
+    tree = KDTree(data)
+    t_build = time.perf_counter() - start
+
+    # the tree ships to worker processes as a handful of arrays
+    tree = pickle.loads(pickle.dumps(tree))
+
+    queries = rng.uniform(0, 1000, (n, 2))
+    start = time.perf_counter()
+    dist, idx = tree.query(queries)
+    t_query = time.perf_counter() - start
+
+    # check against brute force on a sample
+    sample = queries[:200]
+    d2 = ((sample[:, None, :] - data[None, :, :]) ** 2).sum(axis=2)
+    assert np.array_equal(d2.argmin(axis=1), idx[:200])
+    d5, i5 = tree.query(sample, k=5)
+    assert np.allclose(np.sqrt(np.sort(d2, axis=1)[:, :5]), d5)
+    within = tree.query_radius(sample, 3.0)
+    assert all(sorted(w.tolist()) == np.nonzero(row <= 9.0)[0].tolist() for w, row in zip(within, d2))
+
+    # the scan callers do today: min over Points with distance_to
+    points = [Point(x, y) for x, y in data[:100_000].tolist()]
+    q = Point(*queries[0])
+    start = time.perf_counter()
+    min(points, key=q.distance_to)
+    t_scan = (time.perf_counter() - start) * n / len(points)
+
+    start = time.perf_counter()
+    i, j, d = tree.closest_pair()
+    t_pair = time.perf_counter() - start
+    print(f"{n} points: build {t_build:.2f}s, {n} nearest queries {t_query:.2f}s "
+          f"(one Point scan ~{t_scan:.2f}s), closest pair {d:.2e} in {t_pair:.2f}s")
@@ -0,0 +1,290 @@
+from __future__ import annotations
+import math
+import time
+from typing import List, Optional, Union
+import numpy as np
+
+from HW6 import EPS, Point, Triangle, almost_equal
+from GeometryArrays import PointArray, TriangleArray
+from Predicates import orient2d_xy, orient2d_batch
+
+PointsLike = Union[List[Point], PointArray, np.ndarray]
+
+# ---------------------------
+# Helper utilities
+# ---------------------------
+
+def _as_xy(points: PointsLike) -> np.ndarray:
+    # (n, 2) float array from Points, a PointArray or an array
+    if isinstance(points, PointArray):
+        return points.coords.T
+    points = list(points) if not isinstance(points, np.ndarray) else points
+    if len(points) and isinstance(points[0], Point):
+        points = [(p.x, p.y) for p in points]
+    return np.asarray(points, dtype=float).reshape(-1, 2)
+
+def _cross(o, a, b) -> float:
+    return (a[0] - o[0]) * (b[1] - o[1]) - (a[1] - o[1]) * (b[0] - o[0])
+
+def convex_hull(points: PointsLike) -> "Polygon":
+    """
+    Andrew's monotone chain, O(n log n). Returns the hull counter-clockwise,
+    without collinear points on its edges. Turns are decided by the exact
+    orient2d sign, so the result does not depend on the coordinate scale.
+    """
+    xy = np.unique(_as_xy(points), axis=0)  # sorted by x, then y
+    if len(xy) < 3:
+        return Polygon(xy)
+    if len(xy) > 64:
+        # Akl-Toussaint: points inside the octagon of extreme points cannot be on the hull
+        x, y = xy[:, 0], xy[:, 1]
+        extremes = [x.argmin(), (x + y).argmin(), y.argmin(), (x - y).argmax(),
+                    x.argmax(), (x + y).argmax(), y.argmax(), (x - y).argmin()]
+        extremes = [i for k, i in enumerate(extremes) if i != extremes[k - 1]]
+        if len(extremes) >= 3:
+            # the octagon is counter-clockwise: drop points strictly left of every edge
+            ox, oy = xy[extremes].T
+            inside = np.ones(len(xy), dtype=bool)
+            for k in range(len(extremes)):
+                inside &= orient2d_batch(ox[k - 1], oy[k - 1], ox[k], oy[k], x, y) > 0
+            xy = xy[~inside]
+    pts = xy.tolist()
+
+    def chain(seq):
+        out = []
+        for p in seq:
+            while len(out) >= 2 and orient2d_xy(*out[-2], *out[-1], *p) <= 0:
+                out.pop()
+            out.append(p)
+        return out
+
+    lower = chain(pts)
+    upper = chain(reversed(pts))
+    return Polygon(lower[:-1] + upper[:-1])
+
+# ---------------------------
+# Polygon: vertices in one (2, n) buffer, in order
+# ---------------------------
+class Polygon:
+    __slots__ = ("coords",)
+
+    def __init__(self, vertices: PointsLike):
+        self.coords = np.ascontiguousarray(_as_xy(vertices).T)
+
+    @classmethod
+    def from_triangle(cls, t: Triangle) -> "Polygon":
+        return cls([t.p1, t.p2, t.p3])
+
+    @property
+    def vertices(self) -> List[Point]:
+        return [Point(x, y) for x, y in zip(self.coords[0].tolist(), self.coords[1].tolist())]
+
+    def __len__(self) -> int:
+        return self.coords.shape[1]
+
+    def _edges(self):
+        x, y = self.coords
+        return x, y, np.roll(x, -1), np.roll(y, -1)
+
+    def signed_area(self) -> float:
+        # shoelace formula, positive for counter-clockwise vertices
+        x, y, xn, yn = self._edges()
+        return float(np.sum(x * yn - xn * y)) / 2.0
+
+    def area(self) -> float:
+        return abs(self.signed_area())
+
+    def perimeter(self) -> float:
+        x, y, xn, yn = self._edges()
+        return float(np.sum(np.hypot(xn - x, yn - y)))
+
+    def is_ccw(self) -> bool:
+        return self.signed_area() > 0
+
+    def is_convex(self) -> bool:
+        x, y, xn, yn = self._edges()
+        dx, dy = xn - x, yn - y
+        turn = dx * np.roll(dy, -1) - dy * np.roll(dx, -1)
+        return bool(np.all(turn >= -EPS) or np.all(turn <= EPS))
+
+    def contains(self, points: Union[Point, PointsLike]) -> Union[bool, np.ndarray]:
+        """
+        Point-in-polygon by even-odd ray crossing, vectorized over the query
+        points (one pass per edge). Points within EPS of an edge count as inside.
+        Returns a bool for one Point and a bool array otherwise.
+        """
+        single = isinstance(points, Point)
+        q = _as_xy([points] if single else points)
+        px, py = q[:, 0], q[:, 1]
+        inside = np.zeros(len(q), dtype=bool)
+        boundary = np.zeros(len(q), dtype=bool)
+        for x1, y1, x2, y2 in zip(*(a.tolist() for a in self._edges())):
+            dx, dy = x2 - x1, y2 - y1
+            cross = dx * (py - y1) - dy * (px - x1)
+            boundary |= ((np.abs(cross) <= EPS * max(1.0, math.hypot(dx, dy)))
+                         & (px >= min(x1, x2) - EPS) & (px <= max(x1, x2) + EPS)
+                         & (py >= min(y1, y2) - EPS) & (py <= max(y1, y2) + EPS))
+            if dy == 0:
+                continue  # horizontal edges never cross the ray
+            straddles = (y1 > py) != (y2 > py)
+            inside ^= straddles & (px < x1 + (py - y1) * dx / dy)
+        result = inside | boundary
+        return bool(result[0]) if single else result
+
+    def triangulate_indices(self) -> np.ndarray:
+        """
+        Ear clipping, O(n^2) for a simple polygon. Returns (n - 2, 3) vertex
+        indices, each triangle counter-clockwise. Collinear vertices are
+        dropped without emitting a zero-area triangle.
+
+        Only reflex (and collinear) vertices can lie inside an ear, so each
+        ear test scans that set alone, and a clip re-tests just the two
+        neighbours of the removed vertex: O(n) work per clip.
+        """
+        pts = self.coords.T.tolist()
+        n = len(pts)
+        ccw = self.signed_area() >= 0
+        # doubly linked ring in counter-clockwise order
+        nxt = [(i + 1) % n if ccw else (i - 1) % n for i in range(n)]
+        prv = [(i - 1) % n if ccw else (i + 1) % n for i in range(n)]
+        triangles = []
+
+        def turn(j):
+            return _cross(pts[prv[j]], pts[j], pts[nxt[j]])
+
+        blockers = {j for j in range(n) if turn(j) <= EPS}
+
+        def is_ear(j):
+            i, l = prv[j], nxt[j]
+            a, b, c = pts[i], pts[j], pts[l]
+            if _cross(a, b, c) <= EPS:
+                return False
+            for m in blockers:
+                if m in (i, j, l):
+                    continue
+                p = pts[m]
+                if _cross(a, b, p) >= -EPS and _cross(b, c, p) >= -EPS and _cross(c, a, p) >= -EPS:
+                    return False
+            return True
+
+        def unlink(j):
+            i, l = prv[j], nxt[j]
+            nxt[i], prv[l] = l, i
+            blockers.discard(j)
+            for v in (i, l):
+                # a neighbour's angle only shrinks, so it may leave the blocker set
+                if turn(v) > EPS:
+                    blockers.discard(v)
+                else:
+                    blockers.add(v)
+            ear[i], ear[l] = is_ear(i), is_ear(l)
+            return l
+
+        ear = [is_ear(j) for j in range(n)]
+        remaining, j, misses, refreshed = n, (0 if ccw else n - 1), 0, False
+        while remaining > 3:
+            if ear[j]:
+                triangles.append((prv[j], j, nxt[j]))
+                j = unlink(j)
+                remaining -= 1
+                misses, refreshed = 0, False
+                continue
+            j = nxt[j]
+            misses += 1
+            if misses <= remaining:
+                continue
+            # a full lap without an ear: statuses of far vertices may be stale
+            if not refreshed:
+                k = j
+                for _ in range(remaining):
+                    ear[k] = is_ear(k)
+                    k = nxt[k]
+                misses, refreshed = 0, True
+                continue
+            # no strict ear left: remove a collinear vertex, else give up
+            for _ in range(remaining):
+                if abs(turn(j)) <= EPS:
+                    j = unlink(j)
+                    remaining -= 1
+                    misses, refreshed = 0, False
+                    break
+                j = nxt[j]
+            else:
+                raise ValueError("Polygon is not simple")
+        if remaining == 3 and abs(turn(j)) > EPS:
+            triangles.append((prv[j], j, nxt[j]))
+        return np.array(triangles, dtype=int).reshape(-1, 3)
+
+    def triangulate(self, as_array: bool = False) -> Union[List[Triangle], TriangleArray]:
+        idx = self.triangulate_indices()
+        if as_array:
+            t = TriangleArray.__new__(TriangleArray)
+            t.vertices = np.ascontiguousarray(self.coords[:, idx.T].transpose(1, 0, 2))
+            return t
+        pts = self.vertices
+        return [Triangle(pts[i], pts[j], pts[k]) for i, j, k in idx.tolist()]
+
+    def convex_hull(self) -> "Polygon":
+        return convex_hull(self.coords.T)
+
+    def translate(self, dx: float, dy: float) -> "Polygon":
+        return Polygon(PointArray._wrap(self.coords).translate(dx, dy))
+
+    def scale(self, sx: float, sy: Optional[float] = None, center: Optional[Point] = None) -> "Polygon":
+        return Polygon(PointArray._wrap(self.coords).scale(sx, sy, center))
+
+    def rotate(self, angle_degrees: float, center: Optional[Point] = None) -> "Polygon":
+        return Polygon(PointArray._wrap(self.coords).rotate(angle_degrees, center))
+
+    def __repr__(self) -> str:
+        return f"Polygon({', '.join(map(repr, self.vertices))})"
+
+# ---------------------------
+# Example usage in main
+# ---------------------------
+if __name__ == "__main__":
+    # L-shaped (non-convex) polygon
+    L = Polygon([Point(0, 0), Point(4, 0), Point(4, 1), Point(1, 1), Point(1, 3), Point(0, 3)])
+    print(L)
+    print("Area:", L.area(), "Perimeter:", L.perimeter(), "Convex:", L.is_convex())
+    print("Hull:", L.convex_hull(), "area", L.convex_hull().area())
+    tris = L.triangulate()
+    print("Triangulation:", tris)
+    assert almost_equal(sum(t.area() for t in tris), L.area())
+    assert np.allclose(L.triangulate(as_array=True).area().sum(), L.area())
+    print("Contains (0.5, 2), (2, 2), (4, 0.5):",
+          L.contains([Point(0.5, 2), Point(2, 2), Point(4, 0.5)]))
+
+    # a triangle is a 3-gon
+    t = Triangle(Point(0, 0), Point(3, 0), Point(3, 4))
+    assert almost_equal(Polygon.from_triangle(t).area(), t.area())
+
+    rng = np.random.default_rng(0)
+    n = 200_000
+    cloud = rng.standard_normal((n, 2))
+    start = time.perf_counter()
+    hull = convex_hull(cloud)
+    t_hull = time.perf_counter() - start
+    assert np.all(hull.contains(cloud))
+    print(f"hull of {n} points: {len(hull)} vertices in {t_hull:.3f}s")
+
+    # scale-free: the hull of a micro-scale cloud, and of one offset by 1e9,
+    # matches the unit-scale hull vertex for vertex
+    unit = rng.uniform(0, 1, (1000, 2))
+    reference = convex_hull(unit).coords
+    assert np.allclose(convex_hull(unit * 1e-6).coords * 1e6, reference)
+    grid = np.round(unit * 1024) / 1024  # exact after the offset
+    assert np.array_equal(convex_hull(grid + 1e9).coords - 1e9, convex_hull(grid).coords)
+    print(f"hull of 1000 points in a 1e-6 box: {len(convex_hull(unit * 1e-6))} vertices")
+
+    queries = rng.uniform(-0.5, 4.5, (n, 2))
+    start = time.perf_counter()
+    mask = L.contains(queries)
+    t_batch = time.perf_counter() - start
+    pts = [Point(x, y) for x, y in queries[:10_000].tolist()]
+    start = time.perf_counter()
+    loop = [L.contains(p) for p in pts]
+    t_loop = (time.perf_counter() - start) * n / len(pts)
+    assert loop == mask[:10_000].tolist()
+    print(f"point-in-polygon for {n} points: per-Point loop ~{t_loop:.2f}s (extrapolated), "
+          f"batched {t_batch:.4f}s, {mask.mean():.1%} inside")
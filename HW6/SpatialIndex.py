@@ -0,0 +1,273 @@
+from __future__ import annotations
+import math
+import time
+from collections import defaultdict
+from itertools import combinations
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+import numpy as np
+
+from HW6 import (EPS, Point, Line, Circle, Triangle,
+                 intersect_lines, intersect_circles, intersect_line_circle)
+from GeometryArrays import CircleArray, TriangleArray
+
+# A segment is a (Point, Point) tuple; HW6 itself only has infinite Lines.
+Segment = Tuple[Point, Point]
+Shape = Union[Circle, Triangle, Segment]
+Box = Tuple[float, float, float, float]
+
+# ---------------------------
+# Bounding boxes
+# ---------------------------
+
+def bounding_box(obj: Shape) -> Box:
+    if isinstance(obj, Circle):
+        c = obj.center
+        return (c.x - obj.r, c.y - obj.r, c.x + obj.r, c.y + obj.r)
+    if isinstance(obj, Triangle):
+        xs = (obj.p1.x, obj.p2.x, obj.p3.x)
+        ys = (obj.p1.y, obj.p2.y, obj.p3.y)
+        return (min(xs), min(ys), max(xs), max(ys))
+    p, q = obj
+    return (min(p.x, q.x), min(p.y, q.y), max(p.x, q.x), max(p.y, q.y))
+
+def boxes_overlap(a: Box, b: Box) -> bool:
+    return a[0] <= b[2] + EPS and b[0] <= a[2] + EPS and a[1] <= b[3] + EPS and b[1] <= a[3] + EPS
+
+# ---------------------------
+# Exact narrow-phase tests built on the HW6 intersection functions
+# ---------------------------
+
+def _on_segment(p: Point, s: Segment) -> bool:
+    return boxes_overlap(bounding_box(s), (p.x, p.y, p.x, p.y))
+
+def _segment_hits_segment(s1: Segment, s2: Segment) -> bool:
+    status, p = intersect_lines(Line.from_points(*s1), Line.from_points(*s2))
+    if status == "point":
+        return _on_segment(p, s1) and _on_segment(p, s2)
+    if status == "coincident":
+        return boxes_overlap(bounding_box(s1), bounding_box(s2))
+    return False
+
+def _segment_hits_circle(s: Segment, c: Circle) -> bool:
+    status, pts = intersect_line_circle(Line.from_points(*s), c)
+    return any(_on_segment(p, s) for p in pts)
+
+def _edges(t: Triangle) -> List[Segment]:
+    return [(t.p1, t.p2), (t.p2, t.p3), (t.p3, t.p1)]
+
+def _as_segments(obj: Shape) -> List[Segment]:
+    return _edges(obj) if isinstance(obj, Triangle) else [obj]
+
+def intersects(a: Shape, b: Shape) -> bool:
+    """
+    Exact test of whether the outlines of two shapes meet (circles as curves,
+    triangles as their three edges), using the HW6 intersection functions.
+    """
+    if isinstance(a, Circle) and isinstance(b, Circle):
+        return intersect_circles(a, b)[0] != "none"
+    if isinstance(a, Circle):
+        a, b = b, a
+    if isinstance(b, Circle):
+        return any(_segment_hits_circle(s, b) for s in _as_segments(a))
+    return any(_segment_hits_segment(s, t) for s in _as_segments(a) for t in _as_segments(b))
+
+# ---------------------------
+# Uniform grid
+# ---------------------------
+class UniformGrid:
+    """
+    Broad-phase index: every object is registered in each square cell its
+    bounding box touches. Queries only look at the cells they overlap, so
+    finding all candidate pairs costs O(n + k) for evenly sized objects
+    instead of O(n^2). Objects can be inserted, moved and removed one by one.
+    """
+
+    def __init__(self, cell_size: float):
+        if cell_size <= 0:
+            raise ValueError("cell_size must be positive")
+        self.cell_size = float(cell_size)
+        self._cells: Dict[Tuple[int, int], Set[int]] = defaultdict(set)
+        self._boxes: Dict[int, Box] = {}
+        self._objects: Dict[int, Shape] = {}
+        self._next_id = 0
+
+    @classmethod
+    def bulk_load(cls, objects: Union[Iterable[Shape], CircleArray, TriangleArray],
+                  cell_size: Optional[float] = None) -> "UniformGrid":
+        """
+        Builds an index over many objects. Bounding boxes of CircleArray and
+        TriangleArray inputs are computed in one vectorized pass. The default
+        cell size is twice the mean box extent.
+        """
+        if isinstance(objects, CircleArray):
+            x, y, r = objects.center.x, objects.center.y, objects.r
+            boxes = np.stack([x - r, y - r, x + r, y + r], axis=1)
+        elif isinstance(objects, TriangleArray):
+            v = objects.vertices
+            boxes = np.concatenate([v.min(axis=0), v.max(axis=0)]).T
+        else:
+            objects = list(objects)
+            boxes = np.array([bounding_box(o) for o in objects], dtype=float).reshape(-1, 4)
+        if cell_size is None:
+            extent = np.maximum(boxes[:, 2] - boxes[:, 0], boxes[:, 3] - boxes[:, 1])
+            cell_size = 2 * float(extent.mean()) if len(extent) and extent.mean() > 0 else 1.0
+
+        grid = cls(cell_size)
+        for i, box in enumerate(boxes.tolist()):
+            grid._add(objects[i], tuple(box))
+        return grid
+
+    def __len__(self) -> int:
+        return len(self._objects)
+
+    def __getitem__(self, obj_id: int) -> Shape:
+        return self._objects[obj_id]
+
+    def _cell_range(self, box: Box) -> Iterator[Tuple[int, int]]:
+        s = self.cell_size
+        i0, j0 = math.floor(box[0] / s), math.floor(box[1] / s)
+        i1, j1 = math.floor(box[2] / s), math.floor(box[3] / s)
+        for i in range(i0, i1 + 1):
+            for j in range(j0, j1 + 1):
+                yield (i, j)
+
+    def _add(self, obj: Shape, box: Box) -> int:
+        obj_id = self._next_id
+        self._next_id += 1
+        self._objects[obj_id] = obj
+        self._boxes[obj_id] = box
+        for cell in self._cell_range(box):
+            self._cells[cell].add(obj_id)
+        return obj_id
+
+    def insert(self, obj: Shape) -> int:
+        return self._add(obj, bounding_box(obj))
+
+    def remove(self, obj_id: int) -> Shape:
+        box = self._boxes.pop(obj_id)
+        for cell in self._cell_range(box):
+            members = self._cells[cell]
+            members.discard(obj_id)
+            if not members:
+                del self._cells[cell]
+        return self._objects.pop(obj_id)
+
+    def update(self, obj_id: int, obj: Shape):
+        # re-register a moved object under the same id
+        old = self._boxes[obj_id]
+        new = bounding_box(obj)
+        self._objects[obj_id] = obj
+        self._boxes[obj_id] = new
+        old_cells = set(self._cell_range(old))
+        new_cells = set(self._cell_range(new))
+        for cell in old_cells - new_cells:
+            self._cells[cell].discard(obj_id)
+            if not self._cells[cell]:
+                del self._cells[cell]
+        for cell in new_cells - old_cells:
+            self._cells[cell].add(obj_id)
+
+    # ---------------------------
+    # Queries
+    # ---------------------------
+
+    def candidate_pairs(self) -> List[Tuple[int, int]]:
+        """All id pairs (a < b) whose bounding boxes overlap, each reported once."""
+        s = self.cell_size
+        boxes = self._boxes
+        pairs = []
+        for cell, members in self._cells.items():
+            if len(members) < 2:
+                continue
+            for a, b in combinations(sorted(members), 2):
+                ba, bb = boxes[a], boxes[b]
+                if not boxes_overlap(ba, bb):
+                    continue
+                # report the pair only in the cell holding the corner of the overlap
+                corner = (math.floor(max(ba[0], bb[0]) / s), math.floor(max(ba[1], bb[1]) / s))
+                if corner == cell:
+                    pairs.append((a, b))
+        return pairs
+
+    def colliding_pairs(self) -> List[Tuple[int, int]]:
+        """Candidate pairs that survive the exact intersection test."""
+        objects = self._objects
+        return [(a, b) for a, b in self.candidate_pairs() if intersects(objects[a], objects[b])]
+
+    def query_box(self, box: Box) -> List[int]:
+        found = set()
+        for cell in self._cell_range(box):
+            for obj_id in self._cells.get(cell, ()):
+                if obj_id not in found and boxes_overlap(self._boxes[obj_id], box):
+                    found.add(obj_id)
+        return sorted(found)
+
+    def query_point(self, p: Point, radius: float = 0.0) -> List[int]:
+        """Ids whose bounding box comes within `radius` of p."""
+        return self.query_box((p.x - radius, p.y - radius, p.x + radius, p.y + radius))
+
+    def query_line(self, line: Line, distance: float = 0.0) -> List[int]:
+        """
+        Ids whose bounding box comes within `distance` of the infinite line.
+        Only occupied cells are tested, in one vectorized pass.
+        """
+        norm = math.hypot(line.A, line.B)
+        if norm < EPS or not self._cells:
+            return []
+        s = self.cell_size
+        keys = np.array(list(self._cells.keys()), dtype=float)
+        cx, cy = (keys[:, 0] + 0.5) * s, (keys[:, 1] + 0.5) * s
+        # a cell is near if its center is within half a diagonal of the band
+        dist = np.abs(line.A * cx + line.B * cy + line.C) / norm
+        near = np.nonzero(dist <= distance + s * math.sqrt(0.5) + EPS)[0]
+
+        found = set()
+        for k in near.tolist():
+            found.update(self._cells[(int(keys[k, 0]), int(keys[k, 1]))])
+        result = []
+        for obj_id in found:
+            x0, y0, x1, y1 = self._boxes[obj_id]
+            corners = [line.A * x + line.B * y + line.C for x in (x0, x1) for y in (y0, y1)]
+            # the box straddles the line, or its nearest corner is close enough
+            if min(corners) <= distance * norm + EPS and max(corners) >= -distance * norm - EPS:
+                result.append(obj_id)
+        return sorted(result)
+
+# ---------------------------
+# Example usage in main
+# ---------------------------
+if __name__ == "__main__":
+    from GeometryArrays import PointArray
+
+    rng = np.random.default_rng(0)
+    n = 100_000
+    side = math.sqrt(n) * 4
+    circles = CircleArray(PointArray(rng.uniform(0, side, n), rng.uniform(0, side, n)), rng.uniform(0.2, 1.0, n))
+
+    start = time.perf_counter()
+    grid = UniformGrid.bulk_load(circles)
+    pairs = grid.candidate_pairs()
+    t_grid = time.perf_counter() - start
+    start = time.perf_counter()
+    hits = grid.colliding_pairs()
+    t_exact = time.perf_counter() - start
+    print(f"{n} circles: grid build + candidate pairs {t_grid:.2f}s ({len(pairs)} candidates), "
+          f"exact test {t_exact:.2f}s ({len(hits)} intersecting)")
+
+    # brute force on a subset, extrapolated as O(n^2)
+    m = 2000
+    sub = circles[:m].to_circles()
+    start = time.perf_counter()
+    brute = [(a, b) for a, b in combinations(range(m), 2) if intersect_circles(sub[a], sub[b])[0] != "none"]
+    t_brute = (time.perf_counter() - start) * (n / m) ** 2
+    small = UniformGrid.bulk_load(sub)
+    assert sorted(small.colliding_pairs()) == brute
+    print(f"brute-force pairwise check: ~{t_brute:.0f}s (extrapolated from {m} circles)")
+
+    # incremental updates and proximity queries
+    first = grid[0]
+    grid.update(0, first.translate(1, 1))
+    print("near (10, 10):", grid.query_point(Point(10, 10), radius=2))
+    print("near y = 10:", len(grid.query_line(Line(0, 1, -10))), "objects")
+    grid.remove(0)
+    print("objects after removal:", len(grid))
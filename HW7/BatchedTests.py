@@ -0,0 +1,99 @@
+import time
+import numpy as np
+
+from SingleSampleZ_Test import z_test_from_stats
+from SingleSampleT_Test import t_test_1samp_from_stats
+from TwoSampleTTest_Independent import t_test_ind_from_stats
+
+def _pack(data, lengths=None):
+    """
+    Returns (X, mask, n) for a batch of samples.
+    data: an (n_tests, n_samples) array, the same array with a lengths
+    vector (row i uses its first lengths[i] values), or a list of 1-D
+    samples of different lengths (padded here).
+    """
+    if lengths is None and not isinstance(data, np.ndarray):
+        rows = [np.asarray(row, dtype=float) for row in data]
+        lengths = np.array([len(row) for row in rows])
+        X = np.zeros((len(rows), lengths.max(initial=0)))
+        X[np.arange(X.shape[1]) < lengths[:, None]] = np.concatenate(rows) if rows else []
+        data = X
+    X = np.atleast_2d(np.asarray(data, dtype=float))
+    if lengths is None:
+        return X, None, np.full(len(X), X.shape[1])
+    n = np.asarray(lengths)
+    mask = np.arange(X.shape[1]) < n[:, None]
+    return np.where(mask, X, 0.0), mask, n
+
+def _mean_var(X, mask, n):
+    # row means and unbiased (ddof=1) variances with axis-wise reductions
+    mean = X.sum(axis=1) / n
+    dev = X - mean[:, None]
+    if mask is not None:
+        dev = np.where(mask, dev, 0.0)
+    var = (dev * dev).sum(axis=1) / (n - 1)
+    return mean, var
+
+def batch_z_test(data, pop_mean, pop_std, lengths=None, log_p=False):
+    """Vectorized manual_z_test: one Z-test per row. Returns (z, p) arrays."""
+    X, mask, n = _pack(data, lengths)
+    sample_mean = X.sum(axis=1) / n
+    return z_test_from_stats(n, sample_mean, pop_mean, np.asarray(pop_std), log_p)
+
+def batch_t_test_1samp(data, pop_mean, lengths=None, log_p=False):
+    """Vectorized manual_t_test_1samp. Returns (t, p) arrays."""
+    X, mask, n = _pack(data, lengths)
+    sample_mean, sample_var = _mean_var(X, mask, n)
+    return t_test_1samp_from_stats(n, sample_mean, np.sqrt(sample_var), pop_mean, log_p)
+
+def batch_t_test_ind(group1, group2, lengths1=None, lengths2=None, equal_var=True, log_p=False):
+    """Vectorized manual_t_test_ind (pooled, or Welch with equal_var=False). Returns (t, p) arrays."""
+    X1, mask1, n1 = _pack(group1, lengths1)
+    X2, mask2, n2 = _pack(group2, lengths2)
+    mean1, var1 = _mean_var(X1, mask1, n1)
+    mean2, var2 = _mean_var(X2, mask2, n2)
+    return t_test_ind_from_stats(n1, mean1, var1, n2, mean2, var2, equal_var, log_p)
+
+def batch_t_test_paired(before, after, lengths=None, log_p=False):
+    """Vectorized manual_t_test_paired on D = after - before. Returns (t, p) arrays."""
+    B, mask, n = _pack(before, lengths)
+    A, _, _ = _pack(after, lengths)
+    return batch_t_test_1samp(A - B, 0.0, n if mask is not None else None, log_p)
+
+# --- Usage Example ---
+if __name__ == "__main__":
+    from SingleSampleZ_Test import manual_z_test
+    from SingleSampleT_Test import manual_t_test_1samp
+    from TwoSampleTTest_Independent import manual_t_test_ind
+    from TwoSampleTTest_Paired import manual_t_test_paired
+
+    rng = np.random.default_rng(0)
+    n_tests, n_samples = 20000, 50
+    control = rng.normal(10, 2, (n_tests, n_samples))
+    variant = rng.normal(10.1, 2, (n_tests, n_samples))
+
+    start = time.perf_counter()
+    loop = [manual_t_test_ind(a, b) for a, b in zip(control, variant)]
+    t_loop = time.perf_counter() - start
+    start = time.perf_counter()
+    t, p = batch_t_test_ind(control, variant)
+    t_batch = time.perf_counter() - start
+    assert np.allclose(t, [r[0] for r in loop]) and np.allclose(p, [r[1] for r in loop])
+    print(f"--- {n_tests} independent T-tests ---")
+    print(f"Python loop: {t_loop:.2f}s, batched: {t_batch:.3f}s")
+    t_w, p_w = batch_t_test_ind(control[:1000], variant[:1000] * 2, equal_var=False)
+    for i in range(1000):
+        assert np.allclose((t_w[i], p_w[i]), manual_t_test_ind(control[i], variant[i] * 2, equal_var=False))
+
+    # ragged samples: each metric has its own sample size
+    lengths = rng.integers(5, n_samples + 1, 1000)
+    z, pz = batch_z_test(control[:1000], 10, 2, lengths)
+    t1, p1 = batch_t_test_1samp(control[:1000], 10, lengths)
+    tp, pp = batch_t_test_paired(control[:1000], variant[:1000], lengths)
+    for i in range(1000):
+        k = lengths[i]
+        assert np.allclose((z[i], pz[i]), manual_z_test(control[i, :k], 10, 2))
+        assert np.allclose((t1[i], p1[i]), manual_t_test_1samp(control[i, :k], 10))
+        assert np.allclose((tp[i], pp[i]), manual_t_test_paired(control[i, :k], variant[i, :k]))
+    t_r, p_r = batch_t_test_1samp([[48.5, 49.2, 50.1, 49.8, 49.0], [50.2, 49.9, 50.4]], 50)
+    print("Ragged list input -> T:", np.round(t_r, 4), "P:", np.round(p_r, 4))
@@ -0,0 +1,287 @@
+import math
+import os
+import numpy as np
+
+# Pure-NumPy normal and Student-t distributions: the small slice of
+# scipy.stats the HW7 tests use (cdf, sf, logsf), vectorized over arrays.
+# The test scripts import this module as `stats`, so their formulas read the
+# same as with scipy but start without loading scipy (hundreds of ms).
+#
+# BACKEND = "scipy" (or HW7_STATS_BACKEND=scipy in the environment) routes
+# every call to scipy.stats instead, for validation.
+BACKEND = os.environ.get("HW7_STATS_BACKEND", "numpy")
+
+_erfc = np.frompyfunc(math.erfc, 1, 1)
+_lgamma = np.frompyfunc(math.lgamma, 1, 1)
+LOG_SQRT_2PI = 0.5 * math.log(2 * math.pi)
+LGAMMA_HALF = math.lgamma(0.5)
+TINY = 1e-300
+SCALAR_MAX = 16
+CF_TOL = 1e-15
+CF_MAXIT = 10000
+# df/2 from which log B(df/2, 1/2) uses its asymptotic series
+LBETA_SERIES_MIN = 100
+# df from which P(T > t) for t^2 <= df comes from Hill's normal transformation
+HILL_DF_MIN = 1e4
+
+def _scipy():
+    from scipy import stats
+    return stats
+
+def _result(values, shape):
+    # 0-d results come back as np.float64, like scipy's
+    return values.reshape(shape)[()]
+
+def _betacf(a, b, x):
+    # the continued fraction below, for one (a, b, x) in Python floats
+    c, d = 1.0, 1.0 - (a + b) * x / (a + 1.0)
+    d = 1.0 / (d if abs(d) >= TINY else TINY)
+    f = d
+    for m in range(1, CF_MAXIT + 1):
+        for aa in (m * (b - m) * x / ((a + 2*m - 1) * (a + 2*m)),
+                   -(a + m) * (a + b + m) * x / ((a + 2*m) * (a + 2*m + 1))):
+            d = 1.0 + aa * d
+            d = 1.0 / (d if abs(d) >= TINY else TINY)
+            c = 1.0 + aa / c
+            c = c if abs(c) >= TINY else TINY
+            f *= d * c
+        if abs(d * c - 1.0) < CF_TOL:
+            break
+    return f
+
+def _log_betainc_cf(a, b, x, y, lbeta):
+    """
+    log I_x(a, b), the regularized incomplete beta function, for
+    x < (a + 1) / (a + b + 2), where its continued fraction converges fast.
+    y = 1 - x is passed separately so it keeps full precision when x ~ 1,
+    and lbeta = log B(a, b).
+    Continued fraction from Numerical Recipes (betacf), evaluated with the
+    modified Lentz method on all entries at once; converged entries drop out.
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        log_front = a * np.log(x) + b * np.log(y) - np.log(a) - lbeta
+    if len(x) <= SCALAR_MAX:
+        # a handful of values: plain floats beat per-iteration NumPy overhead
+        return np.array([lf + math.log(_betacf(*v)) if math.isfinite(lf) else lf
+                         for lf, v in zip(log_front.tolist(), zip(a.tolist(), b.tolist(), x.tolist()))])
+    h = np.ones_like(x)
+    idx = np.nonzero(np.isfinite(log_front))[0]
+    a_, b_, x_ = a[idx], b[idx], x[idx]
+    ab = a_ + b_
+    c = np.ones_like(x_)
+    d = 1.0 - ab * x_ / (a_ + 1.0)
+    d = 1.0 / np.where(np.abs(d) < TINY, TINY, d)
+    f = d.copy()
+    for m in range(1, CF_MAXIT + 1):
+        a2m = a_ + 2*m
+        # even term m(b - m)x / ((a + 2m - 1)(a + 2m)), then odd term -(a + m)(a + b + m)x / ((a + 2m)(a + 2m + 1))
+        for aa in (m * (b_ - m) * x_ / ((a2m - 1) * a2m), -(a_ + m) * (ab + m) * x_ / (a2m * (a2m + 1))):
+            d *= aa
+            d += 1.0
+            d = 1.0 / np.where(np.abs(d) < TINY, TINY, d)
+            c = 1.0 + aa / c
+            c = np.where(np.abs(c) < TINY, TINY, c)
+            delta = d * c
+            f *= delta
+        # extra terms past convergence leave f unchanged, so only compact now and then
+        if m % 4 == 0 or len(idx) < 64:
+            done = np.abs(delta - 1.0) < CF_TOL
+            if done.any():
+                h[idx[done]] = f[done]
+                keep = ~done
+                idx, a_, b_, ab, x_, c, d, f = idx[keep], a_[keep], b_[keep], ab[keep], x_[keep], c[keep], d[keep], f[keep]
+                if len(idx) == 0:
+                    break
+    h[idx] = f
+    return log_front + np.log(h)
+
+def _log_beta_half(a):
+    """
+    log B(a, 1/2) = lgamma(a) + lgamma(1/2) - lgamma(a + 1/2).
+    For large a the two lgamma terms are nearly equal and their difference
+    loses digits (relative error ~1e-5 by df = 1e10), so there the
+    difference comes from its asymptotic series instead.
+    """
+    out = np.empty_like(a)
+    large = a >= LBETA_SERIES_MIN
+    # Formula: lgamma(a + 1/2) - lgamma(a) = log(a)/2 - 1/(8a) + 1/(192a^3) - 1/(640a^5) + ...
+    u = 1.0 / a[large]
+    out[large] = LGAMMA_HALF - (0.5 * np.log(a[large]) - u * (1 / 8 - u * u * (1 / 192 - u * u / 640)))
+    # lgamma runs per element in Python, so once per distinct a
+    values, inverse = np.unique(a[~large], return_inverse=True)
+    out[~large] = (_lgamma(values) + LGAMMA_HALF - _lgamma(values + 0.5)).astype(float)[inverse]
+    return out
+
+class _Normal:
+    """Standard normal distribution: cdf, sf and logsf."""
+
+    def sf(self, x):
+        if BACKEND == "scipy":
+            return _scipy().norm.sf(x)
+        x = np.asarray(x, dtype=float)
+        # Formula: sf(x) = erfc(x / sqrt(2)) / 2, accurate far into the upper tail
+        return _result(0.5 * _erfc(x.ravel() / math.sqrt(2)).astype(float), x.shape)
+
+    def cdf(self, x):
+        if BACKEND == "scipy":
+            return _scipy().norm.cdf(x)
+        return self.sf(-np.asarray(x, dtype=float))
+
+    def logsf(self, x):
+        if BACKEND == "scipy":
+            return _scipy().norm.logsf(x)
+        x = np.asarray(x, dtype=float)
+        flat = x.ravel()
+        far = flat > 30
+        with np.errstate(divide="ignore"):
+            out = np.log(0.5 * _erfc(np.where(far, 0.0, flat) / math.sqrt(2)).astype(float))
+        # erfc underflows past x ~ 38; use the asymptotic tail series instead
+        # Formula: log sf(x) = -x^2/2 - log(x sqrt(2 pi)) + log(1 - 1/x^2 + 3/x^4 - 15/x^6 + 105/x^8)
+        z = flat[far]
+        u = 1.0 / (z * z)
+        out[far] = -0.5 * z * z - np.log(z) - LOG_SQRT_2PI + np.log1p(u * (-1 + u * (3 + u * (-15 + 105 * u))))
+        return _result(out, x.shape)
+
+class _StudentT:
+    """Student's t distribution with df degrees of freedom: cdf, sf and logsf."""
+
+    def _log_upper(self, t, df):
+        # log P(T > t) for flat arrays with t >= 0
+        # t = inf leaves no mass above it; nan in either argument stays nan
+        out = np.where(np.isnan(t) | np.isnan(df), np.nan, -np.inf)
+        finite = np.isfinite(t)
+        # df = inf is the standard normal
+        normal = finite & np.isposinf(df)
+        if normal.any():
+            out[normal] = norm.logsf(t[normal])
+        # large df near the centre: the continued fraction cancels there (x ~ 1)
+        hill = finite & np.isfinite(df) & (df >= HILL_DF_MIN) & (t * t <= df)
+        if hill.any():
+            out[hill] = self._log_upper_hill(t[hill], df[hill])
+        body = finite & np.isfinite(df) & ~hill
+        if body.any():
+            out[body] = self._log_upper_beta(t[body], df[body])
+        return out
+
+    def _log_upper_hill(self, t, df):
+        # Hill (1970, CACM Algorithm 395): a normal deviate z with P(Z > z) = P(T > t)
+        # for large df, from y = (df - 1/2) log(1 + t^2/df)
+        a = df - 0.5
+        b = 48 * a * a
+        y = a * np.log1p(t * t / df)
+        z = (((((-0.4 * y - 3.3) * y - 24) * y - 85.5) / (0.8 * y * y + 100 + b) + y + 3) / b + 1) * np.sqrt(y)
+        return norm.logsf(z)
+
+    def _log_upper_beta(self, t, df):
+        # log P(T > t) through the incomplete beta function, for finite t and df:
+        # P(T > t) = I_x(df/2, 1/2) / 2 with x = df / (df + t^2)
+        t2 = t * t
+        x = df / (df + t2)
+        y = t2 / (df + t2)
+        a, b = df / 2, np.full_like(df, 0.5)
+        lbeta = _log_beta_half(a)
+        direct = x < (a + 1) / (a + b + 2)
+        log_i = np.empty_like(t)
+        if direct.any():
+            log_i[direct] = _log_betainc_cf(a[direct], b[direct], x[direct], y[direct], lbeta[direct])
+        other = ~direct
+        if other.any():
+            # symmetry: I_x(a, b) = 1 - I_y(b, a); here the result is not tiny
+            log_i[other] = np.log1p(-np.exp(_log_betainc_cf(b[other], a[other], y[other], x[other], lbeta[other])))
+        return log_i - math.log(2)
+
+    def _prepare(self, t, df):
+        t, df = np.broadcast_arrays(np.asarray(t, dtype=float), np.asarray(df, dtype=float))
+        return t.ravel(), df.ravel(), t.shape
+
+    def logsf(self, t, df):
+        if BACKEND == "scipy":
+            return _scipy().t.logsf(t, df)
+        t, df, shape = self._prepare(t, df)
+        log_upper = self._log_upper(np.abs(t), df)
+        # below the median, sf = 1 - P(T > |t|)
+        out = np.where(t >= 0, log_upper, np.log1p(-np.exp(log_upper)))
+        return _result(out, shape)
+
+    def sf(self, t, df):
+        if BACKEND == "scipy":
+            return _scipy().t.sf(t, df)
+        t, df, shape = self._prepare(t, df)
+        upper = np.exp(self._log_upper(np.abs(t), df))
+        return _result(np.where(t >= 0, upper, 1.0 - upper), shape)
+
+    def cdf(self, t, df):
+        if BACKEND == "scipy":
+            return _scipy().t.cdf(t, df)
+        return self.sf(-np.asarray(t, dtype=float), df)
+
+norm = _Normal()
+t = _StudentT()
+
+# --- Usage Example ---
+if __name__ == "__main__":
+    import subprocess
+    import sys
+    import time
+
+    # Validation against scipy over the body and far tails
+    from scipy import stats as sp
+    x = np.concatenate([np.linspace(-10, 10, 2001), [20, 37, 40, 100, 1e3]])
+    assert np.allclose(norm.sf(x), sp.norm.sf(x), rtol=1e-12, atol=0)
+    assert np.allclose(norm.cdf(x), sp.norm.cdf(x), rtol=1e-12, atol=0)
+    assert np.allclose(norm.logsf(x), sp.norm.logsf(x), rtol=1e-12)
+    tv = np.concatenate([np.linspace(-50, 50, 1001), [1e3, 1e5]])
+    for df in [1, 2, 3.5, 9, 30, 48.7, 1000, 1e5]:
+        assert np.allclose(t.sf(tv, df), sp.t.sf(tv, df), rtol=1e-9, atol=1e-300), df
+        assert np.allclose(t.cdf(tv, df), sp.t.cdf(tv, df), rtol=1e-9, atol=1e-300), df
+        # scipy's logsf underflows to -inf in the far tail; compare where it is finite
+        ref = sp.t.logsf(tv, df)
+        finite = np.isfinite(ref)
+        assert np.allclose(t.logsf(tv, df)[finite], ref[finite], rtol=1e-9), df
+        assert np.all(np.isfinite(t.logsf(tv, df)))
+    # Very large df, where lgamma differences and the continued fraction lose digits
+    for df in [9999, 1e4, 1e8, 1e10, 1e12]:
+        assert np.allclose(t.sf(tv, df), sp.t.sf(tv, df), rtol=1e-10, atol=1e-300), df
+        assert np.allclose(t.cdf(tv, df), sp.t.cdf(tv, df), rtol=1e-10, atol=1e-300), df
+        ref = sp.t.logsf(tv, df)
+        finite = np.isfinite(ref)
+        assert np.allclose(t.logsf(tv, df)[finite], ref[finite], rtol=1e-12), df
+    # Infinite arguments: no nan, no warnings
+    with np.errstate(all="raise"):
+        edge = np.array([np.inf, -np.inf, 2.5])
+        assert np.array_equal(t.sf(edge, 5)[:2], [0.0, 1.0])
+        assert np.array_equal(t.cdf(edge, 5)[:2], [1.0, 0.0])
+        assert np.array_equal(t.logsf(edge, 5)[:2], [-np.inf, 0.0])
+        assert np.allclose(t.sf(edge, np.inf), sp.norm.sf(edge), rtol=1e-12, atol=0)
+        assert np.allclose(t.sf(edge, [5, 1e12, np.inf]), sp.t.sf(edge, [5, 1e12, np.inf]), rtol=1e-12, atol=0)
+    for v in [0.0, 0.3, 2.1, -4.0, 60.0]:
+        # single values take the plain-float path
+        assert np.isclose(t.sf(v, 7.5), sp.t.sf(v, 7.5), rtol=1e-12, atol=0)
+        assert np.isclose(t.logsf(v, 7.5), sp.t.logsf(v, 7.5), rtol=1e-12)
+    rng = np.random.default_rng(0)
+    tr, dfr = rng.normal(0, 5, 100_000), rng.uniform(2, 200, 100_000)
+    start = time.perf_counter()
+    ours = t.sf(tr, dfr)
+    t_ours = time.perf_counter() - start
+    start = time.perf_counter()
+    ref = sp.t.sf(tr, dfr)
+    t_ref = time.perf_counter() - start
+    print(f"t.sf on 100,000 values: max rel. error {np.max(np.abs(ours / ref - 1)):.1e}, "
+          f"numpy {t_ours * 1000:.0f}ms, scipy {t_ref * 1000:.0f}ms")
+
+    # Cold start: a fresh interpreter running one test, each way
+    here = os.path.dirname(os.path.abspath(__file__))
+    run_one = ("import sys; sys.path.insert(0, %r); from SingleSampleT_Test import manual_t_test_1samp; "
+               "manual_t_test_1samp([48.5, 49.2, 50.1, 49.8, 49.0], 50)" % here)
+
+    def cold(backend, repeats=5):
+        env = dict(os.environ, HW7_STATS_BACKEND=backend)
+        best = float("inf")
+        for _ in range(repeats):
+            start = time.perf_counter()
+            subprocess.run([sys.executable, "-c", run_one], env=env, check=True)
+            best = min(best, time.perf_counter() - start)
+        return best
+
+    print(f"Cold start, import + one T-test (best of 5): with scipy.stats {cold('scipy') * 1000:.0f}ms, "
+          f"pure NumPy {cold('numpy') * 1000:.0f}ms")
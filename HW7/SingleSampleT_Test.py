@@ -1,7 +1,7 @@
 import numpy as np
-from scipy import stats
+import Distributions as stats
 
-def manual_t_test_1samp(data, pop_mean):
+def manual_t_test_1samp(data, pop_mean, log_p=False):
     """
     Scenario: Single Sample T-Test
     Assumption: Population std dev is UNKNOWN. Use Sample std dev.
@@ -12,7 +12,14 @@ def manual_t_test_1samp(data, pop_mean):
     # Calculate Sample Standard Deviation
     # ddof=1 is crucial here to make it an "unbiased estimator" (dividing by n-1)
     sample_std = np.std(data, ddof=1)
-    
+    return t_test_1samp_from_stats(n, sample_mean, sample_std, pop_mean, log_p)
+
+def t_test_1samp_from_stats(n, sample_mean, sample_std, pop_mean, log_p=False):
+    """
+    The one-sample T-test formula from summary statistics alone.
+    sample_std must be the ddof=1 standard deviation.
+    log_p=True returns the natural log of the p-value instead.
+    """
     # Formula: t = (X_bar - mu) / (S / sqrt(n))
     standard_error = sample_std / np.sqrt(n)
     t_stat = (sample_mean - pop_mean) / standard_error
@@ -20,8 +27,12 @@ def manual_t_test_1samp(data, pop_mean):
     # Degrees of freedom = n - 1
     df = n - 1
     
-    # P-value (Two-tailed) using the T-distribution
-    p_value = 2 * (1 - stats.t.cdf(abs(t_stat), df))
+    # P-value (Two-tailed) using the T-distribution's survival function (sf = 1 - cdf,
+    # without the cancellation)
+    if log_p:
+        p_value = np.log(2) + stats.t.logsf(abs(t_stat), df)
+    else:
+        p_value = 2 * stats.t.sf(abs(t_stat), df)
     
     return t_stat, p_value
 
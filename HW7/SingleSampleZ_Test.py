@@ -1,22 +1,34 @@
 import numpy as np
-from scipy import stats
+import Distributions as stats
 
-def manual_z_test(data, pop_mean, pop_std):
+def manual_z_test(data, pop_mean, pop_std, log_p=False):
     """
     Scenario: Single Sample Z-Test
     Assumption: Population standard deviation (sigma) is KNOWN.
     """
     n = len(data)
     sample_mean = np.mean(data)
-    
+    return z_test_from_stats(n, sample_mean, pop_mean, pop_std, log_p)
+
+def z_test_from_stats(n, sample_mean, pop_mean, pop_std, log_p=False):
+    """
+    The Z-test formula from summary statistics alone (n and the sample mean),
+    so streamed or batched summaries can be tested without the raw data.
+    log_p=True returns the natural log of the p-value instead.
+    """
     # Formula: Z = (X_bar - mu) / (sigma / sqrt(n))
     standard_error = pop_std / np.sqrt(n)
     z_score = (sample_mean - pop_mean) / standard_error
     
     # P-value (Two-tailed test)
-    # We look up the cumulative density up to |z| and subtract from 1 to get the tail,
-    # then multiply by 2 for both tails.
-    p_value = 2 * (1 - stats.norm.cdf(abs(z_score)))
+    # We need the tail beyond |z|, then multiply by 2 for both tails.
+    # 1 - cdf(|z|) rounds to exactly 0 once cdf rounds to 1.0 (|z| > ~8.3), so the
+    # survival function sf(|z|) computes the tail directly. It still underflows
+    # below ~1e-308 (|z| > ~37); logsf keeps even those p-values distinct.
+    if log_p:
+        p_value = np.log(2) + stats.norm.logsf(abs(z_score))
+    else:
+        p_value = 2 * stats.norm.sf(abs(z_score))
     
     return z_score, p_value
 
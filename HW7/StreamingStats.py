@@ -0,0 +1,154 @@
+import time
+import numpy as np
+
+from SingleSampleZ_Test import z_test_from_stats
+from SingleSampleT_Test import t_test_1samp_from_stats
+from TwoSampleTTest_Independent import t_test_ind_from_stats
+from TwoSampleTTest_Paired import t_test_paired_from_stats
+
+class Moments:
+    """
+    Running count, mean and M2 (sum of squared deviations from the mean)
+    of a stream of observations, so a test can be run without keeping the
+    data. Values may be scalars or arrays (one accumulator per metric).
+
+    Welford's update adds one observation at a time; Chan et al.'s merge
+    combines two accumulators, which is how chunks are added and how
+    results from separate shards or workers are combined. Both avoid the
+    catastrophic cancellation of the textbook sum(x^2) - n*mean^2 formula.
+    """
+    __slots__ = ("count", "mean", "m2")
+
+    def __init__(self, count=0, mean=0.0, m2=0.0):
+        self.count = count
+        self.mean = mean
+        self.m2 = m2
+
+    @classmethod
+    def from_data(cls, data, axis=0):
+        """Moments of a whole chunk, reduced along axis (rows = observations)."""
+        data = np.asarray(data, dtype=float)
+        mean = data.mean(axis=axis)
+        dev = data - np.expand_dims(mean, axis)
+        return cls(data.shape[axis], mean, (dev * dev).sum(axis=axis))
+
+    def update(self, x):
+        """Welford: add one observation (or one row of per-metric values)."""
+        self.count += 1
+        delta = x - self.mean
+        self.mean = self.mean + delta / self.count
+        # delta before the update times the deviation after it
+        self.m2 = self.m2 + delta * (x - self.mean)
+        return self
+
+    def update_chunk(self, data, axis=0):
+        """Add a whole chunk of observations at once."""
+        chunk = Moments.from_data(data, axis)
+        if chunk.count:
+            self._absorb(chunk)
+        return self
+
+    def merge(self, other):
+        """Chan et al.: the Moments of both streams together, as a new object."""
+        return Moments(self.count, self.mean, self.m2)._absorb(other)
+
+    __add__ = merge
+
+    def _absorb(self, other):
+        n = self.count + other.count
+        if n == 0:
+            return self
+        # Formula: delta = mean_b - mean_a
+        # mean = mean_a + delta * n_b / n,  M2 = M2_a + M2_b + delta^2 * n_a * n_b / n
+        delta = other.mean - self.mean
+        self.mean = self.mean + delta * (other.count / n)
+        self.m2 = self.m2 + other.m2 + delta * delta * (self.count * other.count / n)
+        self.count = n
+        return self
+
+    def variance(self, ddof=1):
+        return self.m2 / (self.count - ddof)
+
+    def std(self, ddof=1):
+        return np.sqrt(self.variance(ddof))
+
+    def __repr__(self):
+        return f"Moments(count={self.count}, mean={self.mean}, m2={self.m2})"
+
+# --- The HW7 tests, fed from accumulators ---
+
+def z_test_from_moments(m, pop_mean, pop_std, log_p=False):
+    return z_test_from_stats(m.count, m.mean, pop_mean, pop_std, log_p)
+
+def t_test_1samp_from_moments(m, pop_mean, log_p=False):
+    return t_test_1samp_from_stats(m.count, m.mean, m.std(), pop_mean, log_p)
+
+def t_test_ind_from_moments(m1, m2, equal_var=True, log_p=False):
+    return t_test_ind_from_stats(m1.count, m1.mean, m1.variance(), m2.count, m2.mean, m2.variance(),
+                                 equal_var, log_p)
+
+def t_test_paired_from_moments(m_diff, log_p=False):
+    """m_diff accumulates the differences D = after - before."""
+    return t_test_paired_from_stats(m_diff.count, m_diff.mean, m_diff.std(), log_p)
+
+def _shard_moments(args):
+    # one worker: generate (or read) its shard chunk by chunk, return only the summary
+    seed, n_rows, chunk = args
+    rng = np.random.default_rng(seed)
+    m = Moments()
+    for start in range(0, n_rows, chunk):
+        m.update_chunk(rng.normal(1e9 + 0.5, 2.0, (min(chunk, n_rows - start), 3)))
+    return m
+
+# --- Usage Example ---
+if __name__ == "__main__":
+    from concurrent.futures import ProcessPoolExecutor
+    from SingleSampleZ_Test import manual_z_test
+    from SingleSampleT_Test import manual_t_test_1samp
+    from TwoSampleTTest_Independent import manual_t_test_ind
+    from TwoSampleTTest_Paired import manual_t_test_paired
+
+    # Row at a time: agrees with the in-memory tests
+    before = [200, 190, 210, 205, 195]
+    after = [180, 175, 190, 185, 170]
+    m_before, m_after, m_diff = Moments(), Moments(), Moments()
+    for b, a in zip(before, after):
+        m_before.update(b)
+        m_after.update(a)
+        m_diff.update(a - b)
+    assert np.allclose(z_test_from_moments(m_before, 195, 10), manual_z_test(before, 195, 10))
+    assert np.allclose(t_test_1samp_from_moments(m_before, 195), manual_t_test_1samp(before, 195))
+    assert np.allclose(t_test_ind_from_moments(m_before, m_after), manual_t_test_ind(before, after))
+    assert np.allclose(t_test_ind_from_moments(m_before, m_after, equal_var=False),
+                       manual_t_test_ind(before, after, equal_var=False))
+    assert np.allclose(t_test_paired_from_moments(m_diff), manual_t_test_paired(before, after))
+    t, p = t_test_paired_from_moments(m_diff)
+    print(f"Streamed paired T-test: T = {t:.4f}, P = {p:.4f}")
+
+    # Chunks and shards in any split give the same Moments
+    rng = np.random.default_rng(0)
+    data = rng.normal(5, 3, (100_000, 4))
+    whole = Moments.from_data(data)
+    shards = [Moments().update_chunk(part) for part in np.array_split(data, 7)]
+    merged = sum(shards, Moments())
+    assert merged.count == len(data)
+    assert np.allclose(merged.mean, data.mean(axis=0)) and np.allclose(merged.variance(), data.var(axis=0, ddof=1))
+    assert np.allclose(merged.m2, whole.m2)
+
+    # Large offset: the naive sum-of-squares variance loses every digit
+    x = rng.normal(1e9 + 0.5, 2.0, 1_000_000)
+    naive = (np.sum(x * x) - len(x) * np.mean(x) ** 2) / (len(x) - 1)
+    streamed = sum((Moments().update_chunk(c) for c in np.array_split(x, 50)), Moments())
+    print(f"Variance at offset 1e9: exact {np.var(x, ddof=1):.6f}, "
+          f"Welford/Chan {streamed.variance():.6f}, naive sum of squares {naive:.1f}")
+
+    # 20M rows x 3 metrics in 4 shards; workers send back three numbers per metric
+    n_rows, chunk = 20_000_000, 1 << 18
+    jobs = [(seed, n_rows // 4, chunk) for seed in range(4)]
+    start = time.perf_counter()
+    with ProcessPoolExecutor() as pool:
+        total = sum(pool.map(_shard_moments, jobs), Moments())
+    elapsed = time.perf_counter() - start
+    z, p = z_test_from_moments(total, 1e9 + 0.5, 2.0)
+    print(f"{total.count} rows in 4 shards: {elapsed:.2f}s, std {np.round(total.std(), 4)}, "
+          f"Z-test P-values {np.round(p, 4)}")
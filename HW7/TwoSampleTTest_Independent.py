@@ -1,10 +1,11 @@
 import numpy as np
-from scipy import stats
+import Distributions as stats
 
-def manual_t_test_ind(group1, group2):
+def manual_t_test_ind(group1, group2, equal_var=True, log_p=False):
     """
     Scenario: Independent Two-Sample T-Test
     Assumption: Two separate groups, assuming equal variance (Pooled).
+    equal_var=False drops that assumption and runs Welch's T-test instead.
     """
     n1 = len(group1)
     n2 = len(group2)
@@ -14,23 +15,44 @@ def manual_t_test_ind(group1, group2):
     # Calculate Variances (ddof=1)
     var1 = np.var(group1, ddof=1)
     var2 = np.var(group2, ddof=1)
-    
-    # Calculate Pooled Variance (Sp^2)
-    # Formula: ((n1-1)s1^2 + (n2-1)s2^2) / (n1+n2-2)
-    numerator = (n1 - 1)*var1 + (n2 - 1)*var2
-    denominator = n1 + n2 - 2
-    pooled_var = numerator / denominator
-    
-    # Standard Error for difference of means
-    se_diff = np.sqrt(pooled_var * (1/n1 + 1/n2))
+    return t_test_ind_from_stats(n1, mean1, var1, n2, mean2, var2, equal_var, log_p)
+
+def t_test_ind_from_stats(n1, mean1, var1, n2, mean2, var2, equal_var=True, log_p=False):
+    """
+    The pooled-variance (or, with equal_var=False, Welch) T-test formula from
+    each group's size, mean and ddof=1 variance.
+    log_p=True returns the natural log of the p-value instead.
+    """
+    if equal_var:
+        # Calculate Pooled Variance (Sp^2)
+        # Formula: ((n1-1)s1^2 + (n2-1)s2^2) / (n1+n2-2)
+        numerator = (n1 - 1)*var1 + (n2 - 1)*var2
+        denominator = n1 + n2 - 2
+        pooled_var = numerator / denominator
+        
+        # Standard Error for difference of means
+        se_diff = np.sqrt(pooled_var * (1/n1 + 1/n2))
+        
+        # Degrees of freedom
+        df = n1 + n2 - 2
+    else:
+        # Welch: each group keeps its own variance
+        # Formula: SE = sqrt(s1^2/n1 + s2^2/n2)
+        v1 = var1 / n1
+        v2 = var2 / n2
+        se_diff = np.sqrt(v1 + v2)
+        
+        # Welch-Satterthwaite degrees of freedom (not an integer in general)
+        # Formula: (v1 + v2)^2 / (v1^2/(n1-1) + v2^2/(n2-1))
+        df = (v1 + v2)**2 / (v1**2 / (n1 - 1) + v2**2 / (n2 - 1))
     
     # t-statistic
     t_stat = (mean1 - mean2) / se_diff
     
-    # Degrees of freedom
-    df = n1 + n2 - 2
-    
-    p_value = 2 * (1 - stats.t.cdf(abs(t_stat), df))
+    if log_p:
+        p_value = np.log(2) + stats.t.logsf(abs(t_stat), df)
+    else:
+        p_value = 2 * stats.t.sf(abs(t_stat), df)
     
     return t_stat, p_value
 
@@ -46,3 +68,6 @@ if __name__ == "__main__":
     print(f"Mean A: {np.mean(class_a)}, Mean B: {np.mean(class_b)}")
     print(f"T-Statistic: {t:.4f}")
     print(f"P-Value: {p:.4f}")
+    
+    t_w, p_w = manual_t_test_ind(class_a, class_b, equal_var=False)
+    print(f"Welch T-Statistic: {t_w:.4f}, P-Value: {p_w:.4f}")
@@ -1,7 +1,7 @@
 import numpy as np
-from scipy import stats
+import Distributions as stats
 
-def manual_t_test_paired(before, after):
+def manual_t_test_paired(before, after, log_p=False):
     """
     Scenario: Paired T-Test (Dependent)
     Assumption: Same subjects measured at two different times.
@@ -16,7 +16,14 @@ def manual_t_test_paired(before, after):
     # Standard deviation of differences (ddof=1)
     s_d = np.std(differences, ddof=1)
     n = len(differences)
-    
+    return t_test_paired_from_stats(n, d_bar, s_d, log_p)
+
+def t_test_paired_from_stats(n, d_bar, s_d, log_p=False):
+    """
+    The paired T-test formula from the size, mean and ddof=1 standard
+    deviation of the differences D = after - before.
+    log_p=True returns the natural log of the p-value instead.
+    """
     # Formula: t = (d_bar - 0) / (Sd / sqrt(n))
     # We compare against 0 because Null Hypothesis assumes NO change.
     t_stat = d_bar / (s_d / np.sqrt(n))
@@ -24,7 +31,10 @@ def manual_t_test_paired(before, after):
     # Degrees of freedom
     df = n - 1
     
-    p_value = 2 * (1 - stats.t.cdf(abs(t_stat), df))
+    if log_p:
+        p_value = np.log(2) + stats.t.logsf(abs(t_stat), df)
+    else:
+        p_value = 2 * stats.t.sf(abs(t_stat), df)
     
     return t_stat, p_value
 
@@ -1,15 +1,43 @@
+import importlib.util
+import os
+import sys
 import numpy as np
 import scipy.linalg
 
+HW5_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "HW5")
+
+def _hw5_module(name):
+    """
+    Loads HW5/<name>.py by file path, once, without touching sys.path.
+    Bareiss.py does `from HW5 import Rational`, so HW5.py is loaded (and
+    registered under its own name) first.
+    """
+    if name != "HW5":
+        _hw5_module("HW5")
+    if name not in sys.modules:
+        spec = importlib.util.spec_from_file_location(name, os.path.join(HW5_DIR, name + ".py"))
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            del sys.modules[name]
+            raise
+    return sys.modules[name]
+
 def section(title):
     print(f"\n{'='*20} {title} {'='*20}")
 
 # --- 1. Recursive Determinant (The "Slow" Way) ---
-def determinant_recursive(A):
+def determinant_recursive(A, exact=False):
     """
     Calculates determinant using Laplace expansion (O(n!)).
     Only for small matrices!
+    exact=True switches to fraction-free Bareiss elimination (O(n^3), exact
+    Rational result, entries converted from floats without rounding).
     """
+    if exact:
+        return _hw5_module("Bareiss").determinant(A)
     n = len(A)
     if n == 1:
         return A[0,0]
@@ -150,6 +178,7 @@ if __name__ == "__main__":
     
     # 1. Recursive Det
     print(f"Recursive Det (Manual): {determinant_recursive(A)}")
+    print(f"Exact Det (Bareiss): {determinant_recursive(A, exact=True)}")
     
     # 2. LU Det
     lu_det_demo(A)